@@ -2,13 +2,35 @@
 Catalog manager - stores metadata about tables, columns, and indexes.
 """
 import json
+import logging
+from collections import defaultdict
 from typing import Dict, List, Optional, Set
 from pathlib import Path
 from .schema import TableSchema, IndexSchema, ColumnSchema, DataType
 
+logger = logging.getLogger(__name__)
+
+# orjson is an optional C-accelerated encoder; fall back to compact stdlib json
+try:
+    import orjson
+    
+    def _dumps(data: Dict) -> bytes:
+        return orjson.dumps(data)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Dict) -> bytes:
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+    
+    _loads = json.loads
+
 class Catalog:
     """System catalog storing all database metadata."""
     
+    __slots__ = ('storage_manager', 'tables', 'indexes', 'table_counter', 'index_counter',
+                 'table_name_to_id', 'index_name_to_id', 'table_to_indexes',
+                 '_serialized_cache', '_dirty')
+    
     def __init__(self, storage_manager=None):
         self.storage_manager = storage_manager
         self.tables: Dict[str, TableSchema] = {}
@@ -19,6 +41,11 @@ class Catalog:
         # In-memory mappings for fast lookup
         self.table_name_to_id: Dict[str, int] = {}
         self.index_name_to_id: Dict[str, int] = {}
+        self.table_to_indexes: Dict[str, List[IndexSchema]] = defaultdict(list)
+        
+        # Last serialize() output, reused until the next DDL change
+        self._serialized_cache: Optional[bytes] = None
+        self._dirty = True
         
     def create_table(self, table_name: str, columns: List[ColumnSchema]) -> TableSchema:
         """Create a new table schema."""
@@ -33,6 +60,7 @@ class Catalog:
         self.table_counter += 1
         
         schema = TableSchema(table_name, columns, table_id)
+        self._dirty = True
         self.tables[table_name] = schema
         self.table_name_to_id[table_name] = table_id
         
@@ -42,7 +70,7 @@ class Catalog:
             index = IndexSchema(index_name, table_name, schema.primary_key, True)
             self.create_index(index)
         
-        print(f"Created table: {table_name} (id: {table_id})")
+        logger.debug("Created table: %s (id: %d)", table_name, table_id)
         return schema
     
     def drop_table(self, table_name: str) -> None:
@@ -50,20 +78,18 @@ class Catalog:
         if table_name not in self.tables:
             raise ValueError(f"Table '{table_name}' does not exist")
         
-        # Drop all indexes for this table
-        indexes_to_drop = [
-            idx_name for idx_name, idx in self.indexes.items()
-            if idx.table_name == table_name
-        ]
-        
-        for idx_name in indexes_to_drop:
-            self.drop_index(idx_name)
+        # Drop all indexes for this table in one pass; they are known to exist
+        for index in self.table_to_indexes.pop(table_name, ()):
+            del self.indexes[index.index_name]
+            del self.index_name_to_id[index.index_name]
+            logger.debug("Dropped index: %s", index.index_name)
         
         # Remove table
+        self._dirty = True
         del self.tables[table_name]
         del self.table_name_to_id[table_name]
         
-        print(f"Dropped table: {table_name}")
+        logger.debug("Dropped table: %s", table_name)
     
     def create_index(self, index_schema: IndexSchema) -> None:
         """Create a new index."""
@@ -77,46 +103,49 @@ class Catalog:
         # Verify columns exist
         table_schema = self.tables[index_schema.table_name]
         for col_name in index_schema.column_names:
-            if col_name not in table_schema.columns:
+            if col_name not in table_schema.column_index:
                 raise ValueError(f"Column '{col_name}' does not exist in table '{index_schema.table_name}'")
         
         # Assign ID
         index_schema.index_id = self.index_counter
         self.index_counter += 1
         
+        self._dirty = True
         self.indexes[index_schema.index_name] = index_schema
         self.index_name_to_id[index_schema.index_name] = index_schema.index_id
+        self.table_to_indexes[index_schema.table_name].append(index_schema)
         
-        print(f"Created index: {index_schema.index_name} on {index_schema.table_name}")
+        logger.debug("Created index: %s on %s", index_schema.index_name, index_schema.table_name)
     
     def drop_index(self, index_name: str) -> None:
         """Drop an index."""
-        if index_name not in self.indexes:
+        index = self.indexes.pop(index_name, None)
+        if index is None:
             raise ValueError(f"Index '{index_name}' does not exist")
         
-        del self.indexes[index_name]
+        self._dirty = True
         del self.index_name_to_id[index_name]
+        self.table_to_indexes[index.table_name].remove(index)
         
-        print(f"Dropped index: {index_name}")
+        logger.debug("Dropped index: %s", index_name)
     
     def get_table(self, table_name: str) -> TableSchema:
         """Get table schema by name."""
-        if table_name not in self.tables:
+        table = self.tables.get(table_name)
+        if table is None:
             raise ValueError(f"Table '{table_name}' does not exist")
-        return self.tables[table_name]
+        return table
     
     def get_index(self, index_name: str) -> IndexSchema:
         """Get index schema by name."""
-        if index_name not in self.indexes:
+        index = self.indexes.get(index_name)
+        if index is None:
             raise ValueError(f"Index '{index_name}' does not exist")
-        return self.indexes[index_name]
+        return index
     
     def get_table_indexes(self, table_name: str) -> List[IndexSchema]:
         """Get all indexes for a table."""
-        return [
-            idx for idx in self.indexes.values()
-            if idx.table_name == table_name
-        ]
+        return list(self.table_to_indexes.get(table_name, ()))
     
     def _validate_table_creation(self, table_name: str, columns: List[ColumnSchema]) -> None:
         """Validate table creation parameters."""
@@ -127,9 +156,11 @@ class Catalog:
             raise ValueError("Table must have at least one column")
         
         # Check for duplicate column names
-        col_names = [col.name for col in columns]
-        if len(col_names) != len(set(col_names)):
-            raise ValueError("Duplicate column names")
+        seen = set()
+        for col in columns:
+            if col.name in seen:
+                raise ValueError("Duplicate column names")
+            seen.add(col.name)
         
         # Validate primary key
         pk_columns = [col for col in columns if col.is_primary_key]
@@ -144,22 +175,29 @@ class Catalog:
     
     def serialize(self) -> bytes:
         """Serialize catalog to bytes."""
+        if not self._dirty:
+            return self._serialized_cache
+        
         catalog_data = {
             "tables": [table.to_dict() for table in self.tables.values()],
             "indexes": [idx.to_dict() for idx in self.indexes.values()],
             "table_counter": self.table_counter,
             "index_counter": self.index_counter
         }
-        return json.dumps(catalog_data, indent=2).encode('utf-8')
+        self._serialized_cache = _dumps(catalog_data)
+        self._dirty = False
+        return self._serialized_cache
     
     def deserialize(self, data: bytes) -> None:
         """Deserialize catalog from bytes."""
-        catalog_data = json.loads(data.decode('utf-8'))
+        catalog_data = _loads(data)
         
         self.tables.clear()
         self.indexes.clear()
         self.table_name_to_id.clear()
         self.index_name_to_id.clear()
+        self.table_to_indexes.clear()
+        self._dirty = True
         
         # Load tables
         for table_dict in catalog_data.get("tables", []):
@@ -172,6 +210,7 @@ class Catalog:
             index = IndexSchema.from_dict(index_dict)
             self.indexes[index.index_name] = index
             self.index_name_to_id[index.index_name] = index.index_id
+            self.table_to_indexes[index.table_name].append(index)
         
         self.table_counter = catalog_data.get("table_counter", 1)
         self.index_counter = catalog_data.get("index_counter", 1)
\ No newline at end of file
@@ -1,9 +1,11 @@
 """
 Schema definitions for tables, columns, and constraints.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Mapping, Callable
+from types import MappingProxyType
 from enum import Enum
 import json
+import sys
 
 class DataType(Enum):
     """Supported data types."""
@@ -18,6 +20,92 @@ class DataType(Enum):
     TIMESTAMP = "TIMESTAMP"
     BLOB = "BLOB"
 
+# Python type of each column's stored values. DATE and TIMESTAMP values
+# are kept as their SQL string form.
+COLUMN_TYPES: Dict[DataType, type] = {
+    DataType.INTEGER: int,
+    DataType.BIGINT: int,
+    DataType.VARCHAR: str,
+    DataType.TEXT: str,
+    DataType.FLOAT: float,
+    DataType.DOUBLE: float,
+    DataType.BOOLEAN: bool,
+    DataType.DATE: str,
+    DataType.TIMESTAMP: str,
+    DataType.BLOB: bytes,
+}
+
+# Spellings accepted for BOOLEAN values given as strings
+_BOOLEAN_STRINGS = {
+    'true': True, 't': True, 'yes': True, '1': True,
+    'false': False, 'f': False, 'no': False, '0': False,
+}
+
+def _cast_int(value: Any) -> int:
+    """Cast to int, rejecting values that are not whole numbers."""
+    if isinstance(value, str):
+        return int(value)
+    result = int(value)
+    if result != value:
+        raise ValueError(f"{value!r} is not a whole number")
+    return result
+
+def _cast_bool(value: Any) -> bool:
+    """Cast to bool from a bool, 0 or 1, or a true/false spelling."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        result = _BOOLEAN_STRINGS.get(value.strip().lower())
+        if result is None:
+            raise ValueError(f"Invalid BOOLEAN value {value!r}")
+        return result
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    raise ValueError(f"Invalid BOOLEAN value {value!r}")
+
+def _cast_bytes(value: Any) -> bytes:
+    """Cast a bytes-like value to bytes; anything else is an error."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    raise TypeError(f"BLOB values must be bytes, not {type(value).__name__}")
+
+# Function that coerces a value to its column's type, raising ValueError or
+# TypeError rather than losing data
+COLUMN_CASTERS: Dict[DataType, Callable[[Any], Any]] = {
+    DataType.INTEGER: _cast_int,
+    DataType.BIGINT: _cast_int,
+    DataType.VARCHAR: str,
+    DataType.TEXT: str,
+    DataType.FLOAT: float,
+    DataType.DOUBLE: float,
+    DataType.BOOLEAN: _cast_bool,
+    DataType.DATE: str,
+    DataType.TIMESTAMP: str,
+    DataType.BLOB: _cast_bytes,
+}
+
+# Fixed storage size in bytes per type. Variable-length types (VARCHAR,
+# TEXT, BLOB) are stored as an 8-byte pointer to the data.
+_TYPE_SIZES: Mapping[DataType, int] = MappingProxyType({
+    DataType.INTEGER: 4,
+    DataType.BIGINT: 8,
+    DataType.FLOAT: 4,
+    DataType.DOUBLE: 8,
+    DataType.BOOLEAN: 1,
+    DataType.DATE: 8,
+    DataType.TIMESTAMP: 8,
+})
+_POINTER_SIZE = 8
+
+# array.array typecode for columns stored packed in memory. FLOAT keeps
+# double precision so stored values read back unchanged.
+COLUMN_TYPECODES: Mapping[DataType, str] = MappingProxyType({
+    DataType.INTEGER: 'i',
+    DataType.BIGINT: 'q',
+    DataType.FLOAT: 'd',
+    DataType.DOUBLE: 'd',
+})
+
 class ColumnConstraint(Enum):
     """Column constraints."""
     PRIMARY_KEY = "PRIMARY KEY"
@@ -28,11 +116,18 @@ class ColumnConstraint(Enum):
 class ColumnSchema:
     """Schema definition for a single column."""
     
+    __slots__ = ('name', 'data_type', 'constraints', 'length', 'default_value',
+                 'is_primary_key', 'is_unique', 'is_not_null', 'encoding')
+    
+    # Short VARCHAR columns are dictionary-encoded in memory
+    DICT_ENCODE_MAX_LENGTH = 64
+    
     def __init__(self, name: str, data_type: DataType, 
                  constraints: Optional[List[ColumnConstraint]] = None,
                  length: Optional[int] = None,
                  default_value: Any = None):
-        self.name = name
+        # Interned so dict lookups by column name can match on identity
+        self.name = sys.intern(name)
         self.data_type = data_type
         self.constraints = constraints or []
         self.length = length  # For VARCHAR types
@@ -42,6 +137,13 @@ class ColumnSchema:
         self.is_primary_key = ColumnConstraint.PRIMARY_KEY in self.constraints
         self.is_unique = (ColumnConstraint.UNIQUE in self.constraints) or self.is_primary_key
         self.is_not_null = (ColumnConstraint.NOT_NULL in self.constraints) or self.is_primary_key
+        
+        # In-memory encoding: "dict" or "flat"
+        if (data_type == DataType.VARCHAR and length is not None
+                and length <= self.DICT_ENCODE_MAX_LENGTH):
+            self.encoding = "dict"
+        else:
+            self.encoding = "flat"
     
     def __repr__(self) -> str:
         constraints_str = " ".join([c.value for c in self.constraints])
@@ -73,40 +175,42 @@ class ColumnSchema:
     
     def get_storage_size(self) -> int:
         """Get estimated storage size in bytes."""
-        type_sizes = {
-            DataType.INTEGER: 4,
-            DataType.BIGINT: 8,
-            DataType.FLOAT: 4,
-            DataType.DOUBLE: 8,
-            DataType.BOOLEAN: 1,
-            DataType.DATE: 8,
-            DataType.TIMESTAMP: 8,
-        }
-        
-        if self.data_type in type_sizes:
-            return type_sizes[self.data_type]
-        elif self.data_type in [DataType.VARCHAR, DataType.TEXT, DataType.BLOB]:
-            # Variable length - return pointer size
-            return 8  # Pointer to actual data
-        return 8  # Default
+        return _TYPE_SIZES.get(self.data_type, _POINTER_SIZE)
 
 class TableSchema:
     """Schema definition for a table."""
     
+    __slots__ = ('table_name', 'table_id', '_columns', '_column_map', 'column_names',
+                 'column_types', 'column_casters', 'primary_key', 'column_index')
+    
     def __init__(self, table_name: str, columns: List[ColumnSchema],
                  table_id: int = 0):
         self.table_name = table_name
         self.table_id = table_id
-        self.columns = {col.name: col for col in columns}
+        # Columns in table order, for iteration
+        self._columns: Tuple[ColumnSchema, ...] = tuple(columns)
+        self._column_map = {col.name: col for col in self._columns}
+        self.column_names: Tuple[str, ...] = tuple(col.name for col in self._columns)
+        self.column_types: Tuple[type, ...] = tuple(
+            COLUMN_TYPES[col.data_type] for col in self._columns
+        )
+        self.column_casters: Tuple[Callable[[Any], Any], ...] = tuple(
+            COLUMN_CASTERS[col.data_type] for col in self._columns
+        )
         
         # Extract primary key columns
         self.primary_key = [col.name for col in columns if col.is_primary_key]
         
         # Build column index map
-        self.column_index = {col.name: idx for idx, col in enumerate(columns)}
+        self.column_index = {col.name: idx for idx, col in enumerate(self._columns)}
+    
+    @property
+    def columns(self) -> Mapping[str, ColumnSchema]:
+        """Read-only name -> ColumnSchema view, in table order."""
+        return MappingProxyType(self._column_map)
     
     def __repr__(self) -> str:
-        cols = ", ".join([repr(col) for col in self.columns.values()])
+        cols = ", ".join([repr(col) for col in self._columns])
         return f"Table: {self.table_name} (id: {self.table_id})\nColumns: {cols}"
     
     def to_dict(self) -> Dict:
@@ -114,7 +218,7 @@ class TableSchema:
         return {
             "table_name": self.table_name,
             "table_id": self.table_id,
-            "columns": [col.to_dict() for col in self.columns.values()],
+            "columns": [col.to_dict() for col in self._columns],
             "primary_key": self.primary_key
         }
     
@@ -127,26 +231,30 @@ class TableSchema:
     
     def get_column(self, name: str) -> ColumnSchema:
         """Get column by name."""
-        if name not in self.columns:
+        column = self._column_map.get(name)
+        if column is None:
             raise ValueError(f"Column '{name}' not found in table '{self.table_name}'")
-        return self.columns[name]
+        return column
     
     def get_column_index(self, name: str) -> int:
         """Get column index by name."""
-        if name not in self.column_index:
+        index = self.column_index.get(name)
+        if index is None:
             raise ValueError(f"Column '{name}' not found in table '{self.table_name}'")
-        return self.column_index[name]
+        return index
     
     def get_row_size(self) -> int:
         """Get estimated row size in bytes."""
         # Header + data
         header_size = 8  # Row header (status, next row pointer)
-        data_size = sum(col.get_storage_size() for col in self.columns.values())
+        data_size = sum(col.get_storage_size() for col in self._columns)
         return header_size + data_size
 
 class IndexSchema:
     """Schema definition for an index."""
     
+    __slots__ = ('index_name', 'table_name', 'column_names', 'is_unique', 'index_id')
+    
     def __init__(self, index_name: str, table_name: str, 
                  column_names: List[str], is_unique: bool = False):
         self.index_name = index_name
@@ -1,18 +1,62 @@
 """
 Query Executor - executes SQL operations using our storage and catalog.
 """
-from typing import List, Dict, Any, Optional, Tuple, Iterator
+from typing import (List, Dict, Any, NamedTuple, Optional, Tuple, Iterator, Iterable,
+                    Callable, Sequence, FrozenSet)
 from dataclasses import dataclass
 from enum import Enum
+import functools
+import itertools
 import struct
+import sys
 import time
 
 from ..catalog.catalog import Catalog
-from ..catalog.schema import TableSchema, ColumnSchema, DataType
+from ..catalog.schema import TableSchema, ColumnSchema, IndexSchema, DataType, COLUMN_TYPECODES
 from ..storage.storage_manager import StorageManager
+from ..storage.column_store import ColumnStore, ColumnBatch
 from ..index.simple_bplus_tree import SimpleBPlusTree
 from ..index.index_manager import IndexManager
 
+# WHERE operators and the Python operator each compiles to
+_COMPARISON_OPS = {
+    '=': '==',
+    '!=': '!=',
+    '>': '>',
+    '<': '<',
+    '>=': '>=',
+    '<=': '<=',
+}
+
+@functools.lru_cache(maxsize=256)
+def _compile_predicate(ops: Tuple[str, ...], lazy: bool = False) -> Callable[..., Iterable[int]]:
+    """Compile a WHERE clause shape into a fused position scan.
+    
+    ops holds one operator per condition. The returned function takes a
+    column and its literal for each condition, e.g. for ('>', '=') it is
+    
+        lambda c0, l0, c1, l1: [i for i, (v0, v1) in enumerate(zip(c0, c1))
+                                if v0 > l0 and v1 == l1]
+    
+    so all conditions are tested in one pass, without per-row operator
+    dispatch. Literals are arguments, so every query of the same shape
+    shares the compiled code. A lazy scan yields positions from a generator
+    instead, so a LIMIT can stop it early.
+    """
+    params = ", ".join(f"c{i}, l{i}" for i in range(len(ops)))
+    values = ", ".join(f"v{i}" for i in range(len(ops)))
+    if len(ops) == 1:
+        rows = "enumerate(c0)"
+    else:
+        values = f"({values})"
+        rows = "enumerate(zip({}))".format(", ".join(f"c{i}" for i in range(len(ops))))
+    test = " and ".join(
+        f"v{i} {_COMPARISON_OPS[op]} l{i}" for i, op in enumerate(ops)
+    )
+    body = f"i for i, {values} in {rows} if {test}"
+    source = f"lambda {params}: ({body})" if lazy else f"lambda {params}: [{body}]"
+    return eval(compile(source, "<where>", "eval"))
+
 class QueryType(Enum):
     """Types of SQL queries."""
     SELECT = "SELECT"
@@ -24,25 +68,124 @@ class QueryType(Enum):
     CREATE_INDEX = "CREATE_INDEX"
     DROP_INDEX = "DROP_INDEX"
 
-@dataclass
 class QueryResult:
-    """Result of a query execution."""
-    success: bool
-    message: str
-    data: Optional[List[Dict[str, Any]]] = None
-    rows_affected: int = 0
-    execution_time: float = 0.0
+    """Result of a query execution.
+    
+    A failure caused by an exception keeps it in `error`, and `message` is
+    only formatted as "<message>: <error>" when first read.
+    
+    SELECT results hold their values column-wise in `column_data`; the
+    row dictionaries in `data` are only built when first read.
+    """
+    
+    __slots__ = ('success', '_message', '_formatted', 'error', '_data',
+                 'column_data', 'rows_affected', 'execution_time_ns')
+    
+    def __init__(self, success: bool, message: str = "",
+                 data: Optional[List[Dict[str, Any]]] = None,
+                 rows_affected: int = 0, execution_time_ns: int = 0,
+                 error: Optional[Exception] = None,
+                 column_data: Optional[Dict[str, List[Any]]] = None):
+        self.success = success
+        self._message = message
+        self._formatted: Optional[str] = None
+        self.error = error
+        self._data = data
+        self.column_data = column_data
+        self.rows_affected = rows_affected
+        self.execution_time_ns = execution_time_ns
+    
+    def __repr__(self) -> str:
+        return (f"QueryResult(success={self.success!r}, message={self.message!r}, "
+                f"rows_affected={self.rows_affected!r})")
+    
+    @property
+    def message(self) -> str:
+        """Human-readable outcome of the query."""
+        if self._formatted is None:
+            if self.error is None:
+                self._formatted = self._message
+            else:
+                self._formatted = f"{self._message}: {self.error}"
+        return self._formatted
+    
+    @property
+    def data(self) -> Optional[List[Dict[str, Any]]]:
+        """Result rows as column name -> value dictionaries."""
+        if self._data is None and self.column_data is not None:
+            columns = list(self.column_data)
+            self._data = [
+                dict(zip(columns, values)) for values in zip(*self.column_data.values())
+            ]
+        return self._data
+    
+    @data.setter
+    def data(self, data: Optional[List[Dict[str, Any]]]) -> None:
+        self._data = data
+        self.column_data = None
+    
+    @property
+    def execution_time(self) -> float:
+        """Execution time in seconds."""
+        return self.execution_time_ns / 1e9
 
-@dataclass
-class Row:
-    """A single database row."""
-    values: List[Any]
-    row_id: int = 0  # Physical row identifier
+class Row(NamedTuple):
+    """A single database row, built on demand from the column store."""
+    row_id: int  # Physical row identifier
+    values: Tuple[Any, ...]
     
     def to_dict(self, columns: List[str]) -> Dict[str, Any]:
         """Convert row to dictionary with column names."""
         return {columns[i]: self.values[i] for i in range(len(columns))}
 
+def _split_condition(condition: Any) -> Tuple[str, Any]:
+    """Split a WHERE condition into (operator, value); bare values mean '='."""
+    return condition if isinstance(condition, tuple) else ('=', condition)
+
+def _column_keys(key_columns: Sequence[Iterable[Any]]) -> List[Any]:
+    """Build index keys from the indexed columns, matching _index_key."""
+    if len(key_columns) == 1:
+        return list(key_columns[0])
+    return list(zip(*key_columns))
+
+def _index_key(values: Sequence[Any], positions: Tuple[int, ...]) -> Any:
+    """Build the index key for a row from the values at positions.
+    
+    Single-column keys are the value itself; composite keys are tuples.
+    """
+    if len(positions) == 1:
+        return values[positions[0]]
+    return tuple([values[i] for i in positions])
+
+@dataclass(slots=True)
+class PreparedInsert:
+    """INSERT plan for one table, resolved once and reused per row."""
+    table_schema: TableSchema
+    column_count: int
+    # Per-column coercion functions, in column order
+    casters: Tuple[Callable[[Any], Any], ...]
+    # (index name, positions of the indexed columns) for every table index
+    index_columns: List[Tuple[str, Tuple[int, ...]]]
+    # Names of the indexes that reject duplicate keys
+    unique_indexes: FrozenSet[str]
+    
+    def cast(self, values: Sequence[Any]) -> List[Any]:
+        """Coerce a row's values to the column types; NULLs pass through."""
+        return [
+            value if value is None else cast(value)
+            for cast, value in zip(self.casters, values)
+        ]
+    
+    def index_entries(self, values: List[Any]) -> Iterator[Tuple[str, Any]]:
+        """Yield the (index name, key) pairs for a row's values."""
+        for index_name, positions in self.index_columns:
+            yield index_name, _index_key(values, positions)
+    
+    def index_batches(self, rows: List[List[Any]]) -> Iterator[Tuple[str, List[Any]]]:
+        """Yield each index name with the keys for all rows, in row order."""
+        for index_name, positions in self.index_columns:
+            yield index_name, [_index_key(values, positions) for values in rows]
+
 class QueryExecutor:
     """Executes SQL queries using our storage system."""
     
@@ -51,10 +194,18 @@ class QueryExecutor:
         self.storage = storage_manager
         self.index_manager = IndexManager()
         self.current_transaction = None
+        # Prepared plans keyed on (QueryType, table name); cleared on DDL
+        self._plan_cache: Dict[Tuple[QueryType, str], PreparedInsert] = {}
+        # Table name -> (schema, indexes); cleared on DDL
+        self._schema_cache: Dict[str, Tuple[TableSchema, List[IndexSchema]]] = {}
+        # Next unused row ID for each table
+        self._next_row_id: Dict[str, int] = {}
+        # In-memory rows for each table, created on first insert
+        self._table_data: Dict[str, ColumnStore] = {}
     
     def execute(self, query_type: QueryType, **kwargs) -> QueryResult:
         """Execute a query."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             if query_type == QueryType.CREATE_TABLE:
@@ -79,26 +230,98 @@ class QueryExecutor:
                     message=f"Unsupported query type: {query_type}"
                 )
             
-            result.execution_time = time.time() - start_time
+            result.execution_time_ns = time.perf_counter_ns() - start_time
             return result
             
         except Exception as e:
             return QueryResult(
                 success=False,
-                message=f"Error executing query: {str(e)}",
-                execution_time=time.time() - start_time
+                message="Error executing query", error=e,
+                execution_time_ns=time.perf_counter_ns() - start_time
             )
+
+    def insert_many(self, table_name: str, rows: List[Tuple[Any, ...]]) -> QueryResult:
+        """Insert many rows at once, bypassing the SQL parser.
+
+        The table schema is looked up once for the whole batch and every
+        row is validated before any of them is stored.
+        """
+        start_time = time.perf_counter_ns()
+
+        try:
+            plan = self._prepare_insert(table_name)
+            column_count = plan.column_count
+
+            for values in rows:
+                if len(values) != column_count:
+                    return QueryResult(
+                        success=False,
+                        message=f"Expected {column_count} values, got {len(values)}",
+                        execution_time_ns=time.perf_counter_ns() - start_time
+                    )
+
+            # Coerce and check the whole batch before storing any of it
+            rows = [plan.cast(values) for values in rows]
+            self._check_unique(plan, rows)
+
+            # Row IDs for the batch are allocated as one contiguous range
+            first_row_id = self._get_next_row_id(table_name, len(rows))
+
+            row_ids = range(first_row_id, first_row_id + len(rows))
+
+            # Append the batch column by column, then fill each index in
+            # one call
+            self._get_or_create_store(table_name).extend(row_ids, rows)
+            for index_name, keys in plan.index_batches(rows):
+                self.index_manager.insert_many(index_name, zip(keys, row_ids))
+
+            return QueryResult(
+                success=True,
+                message=f"{len(rows)} rows inserted successfully into '{table_name}'",
+                rows_affected=len(rows),
+                execution_time_ns=time.perf_counter_ns() - start_time
+            )
+        except Exception as e:
+            return QueryResult(
+                success=False,
+                message=f"Failed to insert into '{table_name}'", error=e,
+                execution_time_ns=time.perf_counter_ns() - start_time
+            )
+
+    def _prepare_insert(self, table_name: str) -> PreparedInsert:
+        """Get the cached INSERT plan for a table, building it on first use."""
+        key = (QueryType.INSERT, table_name)
+        plan = self._plan_cache.get(key)
+        if plan is None:
+            table_schema, indexes = self._get_schema(table_name)
+            index_columns = [
+                (index.index_name,
+                 tuple(table_schema.column_index[col] for col in index.column_names))
+                for index in indexes
+            ]
+            unique_indexes = frozenset(
+                index.index_name for index in indexes if index.is_unique
+            )
+            plan = PreparedInsert(table_schema, len(table_schema.column_names),
+                                  table_schema.column_casters, index_columns,
+                                  unique_indexes)
+            self._plan_cache[key] = plan
+        return plan
     
     def _execute_create_table(self, table_name: str, columns: List[ColumnSchema]) -> QueryResult:
         """Execute CREATE TABLE query."""
+        self._invalidate_caches()
         try:
             # Create table in catalog
             table_schema = self.catalog.create_table(table_name, columns)
+            self._next_row_id[table_name] = 1
             
             # Create primary key index if needed
             if table_schema.primary_key:
                 index_name = f"pk_{table_name}"
-                self.index_manager.create_index(index_name)
+                self.index_manager.create_index(
+                    index_name, key_type=self._index_key_type(table_schema, table_schema.primary_key)
+                )
             
             return QueryResult(
                 success=True,
@@ -108,30 +331,33 @@ class QueryExecutor:
         except Exception as e:
             return QueryResult(
                 success=False,
-                message=f"Failed to create table '{table_name}': {str(e)}"
+                message=f"Failed to create table '{table_name}'", error=e
             )
     
     def _execute_insert(self, table_name: str, values: List[Any]) -> QueryResult:
         """Execute INSERT query."""
         try:
-            table_schema = self.catalog.get_table(table_name)
+            plan = self._prepare_insert(table_name)
             
             # Validate values count
-            if len(values) != len(table_schema.columns):
+            if len(values) != plan.column_count:
                 return QueryResult(
                     success=False,
-                    message=f"Expected {len(table_schema.columns)} values, got {len(values)}"
+                    message=f"Expected {plan.column_count} values, got {len(values)}"
                 )
             
+            values = plan.cast(values)
+            self._check_unique(plan, [values])
+            
             # Generate row ID (simple auto-increment for now)
             row_id = self._get_next_row_id(table_name)
             
             # Store row
-            row = Row(values=values, row_id=row_id)
-            self._store_row(table_name, row)
+            self._store_row(table_name, row_id, values)
             
             # Update indexes
-            self._update_indexes_for_row(table_name, row)
+            for index_name, key in plan.index_entries(values):
+                self.index_manager.insert(index_name, key, row_id)
             
             return QueryResult(
                 success=True,
@@ -141,7 +367,7 @@ class QueryExecutor:
         except Exception as e:
             return QueryResult(
                 success=False,
-                message=f"Failed to insert into '{table_name}': {str(e)}"
+                message=f"Failed to insert into '{table_name}'", error=e
             )
     
     def _execute_select(self, table_name: str, columns: List[str] = None, 
@@ -149,70 +375,91 @@ class QueryExecutor:
                        limit: Optional[int] = None) -> QueryResult:
         """Execute SELECT query."""
         try:
-            table_schema = self.catalog.get_table(table_name)
+            table_schema, _ = self._get_schema(table_name)
             
-            # If columns is None, select all columns
+            # If columns is None, select all columns; otherwise intern the
+            # requested names to match the schema's interned keys
             if columns is None:
-                columns = list(table_schema.columns.keys())
+                columns = list(table_schema.column_names)
+            else:
+                columns = [sys.intern(col_name) for col_name in columns]
             
-            # Get all rows (simple full scan for now)
-            rows = self._get_all_rows(table_name)
+            # Resolve projected column positions once
+            col_indexes = [table_schema.column_index[col_name] for col_name in columns]
             
-            # Apply WHERE clause if provided
+            # Filter with the WHERE predicate and LIMIT pushed down, then
+            # project only the selected columns at the matching positions
+            batch = self._get_all_rows(table_name)
+            positions = None
             if where_clause:
-                rows = self._apply_where_clause(rows, table_schema, where_clause)
-            
-            # Apply LIMIT if provided
-            if limit is not None:
-                rows = rows[:limit]
+                positions = self._apply_where_clause(batch, table_schema, where_clause, limit)
+            elif limit is not None:
+                positions = batch.positions()[:max(limit, 0)]
             
-            # Convert rows to dictionaries
-            data = []
-            for row in rows:
-                row_dict = {}
-                for i, col_name in enumerate(columns):
-                    col_index = table_schema.column_index[col_name]
-                    row_dict[col_name] = row.values[col_index]
-                data.append(row_dict)
+            # Keep the result column-wise; row dictionaries are built only
+            # if the caller reads QueryResult.data
+            column_data = dict(zip(columns, batch.project(col_indexes, positions)))
+            row_count = len(batch) if positions is None else len(positions)
             
             return QueryResult(
                 success=True,
-                message=f"Selected {len(data)} rows from '{table_name}'",
-                data=data,
-                rows_affected=len(data)
+                message=f"Selected {row_count} rows from '{table_name}'",
+                column_data=column_data,
+                rows_affected=row_count
             )
         except Exception as e:
             return QueryResult(
                 success=False,
-                message=f"Failed to select from '{table_name}': {str(e)}"
+                message=f"Failed to select from '{table_name}'", error=e
             )
     
     def _execute_update(self, table_name: str, set_values: Dict[str, Any],
                        where_clause: Optional[Dict] = None) -> QueryResult:
         """Execute UPDATE query."""
         try:
-            table_schema = self.catalog.get_table(table_name)
+            table_schema, _ = self._get_schema(table_name)
             
             # Get all rows
-            rows = self._get_all_rows(table_name)
+            batch = self._get_all_rows(table_name)
             
             # Apply WHERE clause if provided
+            positions = batch.positions()
             if where_clause:
-                rows = self._apply_where_clause(rows, table_schema, where_clause)
+                positions = self._apply_where_clause(batch, table_schema, where_clause)
             
-            rows_updated = 0
-            
-            # Update each matching row
-            for row in rows:
-                # Update values
+            # Update each assigned column at the matching positions
+            store = self._get_store(table_name)
+            if store is not None:
+                # Cast new values as INSERT does, before any index sees them
+                cast_values = {}
+                for col_name, new_value in set_values.items():
+                    col_index = table_schema.column_index.get(col_name)
+                    if col_index is None:
+                        continue
+                    if new_value is not None:
+                        try:
+                            new_value = table_schema.column_casters[col_index](new_value)
+                        except (TypeError, ValueError) as e:
+                            return QueryResult(
+                                success=False,
+                                message=f"Invalid value {new_value!r} for column '{col_name}'",
+                                error=e
+                            )
+                    cast_values[col_name] = new_value
+                set_values = cast_values
+                index_changes = self._index_changes(batch, table_schema, positions, set_values)
+                row_ids = [batch.row_ids[p] for p in positions]
+                
                 for col_name, new_value in set_values.items():
-                    if col_name in table_schema.column_index:
-                        col_index = table_schema.column_index[col_name]
-                        row.values[col_index] = new_value
+                    store.update(positions, table_schema.column_index[col_name], new_value)
                 
-                # Save updated row
-                self._store_row(table_name, row)
-                rows_updated += 1
+                # Move the updated rows' index entries to their new keys
+                for index_name, old_keys, new_keys in index_changes:
+                    for key in old_keys:
+                        self.index_manager.delete(index_name, key)
+                    self.index_manager.insert_many(index_name, zip(new_keys, row_ids))
+            
+            rows_updated = len(positions)
             
             return QueryResult(
                 success=True,
@@ -222,27 +469,31 @@ class QueryExecutor:
         except Exception as e:
             return QueryResult(
                 success=False,
-                message=f"Failed to update '{table_name}': {str(e)}"
+                message=f"Failed to update '{table_name}'", error=e
             )
     
     def _execute_delete(self, table_name: str, 
                        where_clause: Optional[Dict] = None) -> QueryResult:
         """Execute DELETE query."""
         try:
-            table_schema = self.catalog.get_table(table_name)
+            table_schema, indexes = self._get_schema(table_name)
             
             # Get all rows
-            rows = self._get_all_rows(table_name)
+            batch = self._get_all_rows(table_name)
             
             # Apply WHERE clause if provided
+            positions = batch.positions()
             if where_clause:
-                rows = self._apply_where_clause(rows, table_schema, where_clause)
+                positions = self._apply_where_clause(batch, table_schema, where_clause)
             
-            rows_deleted = len(rows)
+            rows_deleted = len(positions)
             
-            # Remove rows (simple implementation - mark as deleted)
-            for row in rows:
-                self._delete_row(table_name, row)
+            store = self._get_store(table_name)
+            if store is not None:
+                for index in indexes:
+                    for key in self._index_keys(batch, table_schema, index.column_names, positions):
+                        self.index_manager.delete(index.index_name, key)
+                store.delete_many(positions)
             
             return QueryResult(
                 success=True,
@@ -252,13 +503,18 @@ class QueryExecutor:
         except Exception as e:
             return QueryResult(
                 success=False,
-                message=f"Failed to delete from '{table_name}': {str(e)}"
+                message=f"Failed to delete from '{table_name}'", error=e
             )
     
     def _execute_drop_table(self, table_name: str) -> QueryResult:
         """Execute DROP TABLE query."""
+        self._invalidate_caches()
         try:
             self.catalog.drop_table(table_name)
+            
+            # Discard the table's rows so a recreated table starts empty
+            self._table_data.pop(table_name, None)
+            self._next_row_id.pop(table_name, None)
             return QueryResult(
                 success=True,
                 message=f"Table '{table_name}' dropped successfully",
@@ -267,29 +523,25 @@ class QueryExecutor:
         except Exception as e:
             return QueryResult(
                 success=False,
-                message=f"Failed to drop table '{table_name}': {str(e)}"
+                message=f"Failed to drop table '{table_name}'", error=e
             )
     
     def _execute_create_index(self, index_name: str, table_name: str, 
                             column_names: List[str]) -> QueryResult:
         """Execute CREATE INDEX query."""
+        self._invalidate_caches()
         try:
-            self.index_manager.create_index(index_name)
+            table_schema, _ = self._get_schema(table_name)
+            self.index_manager.create_index(
+                index_name, key_type=self._index_key_type(table_schema, column_names)
+            )
             
             # Build index from existing data
-            table_schema = self.catalog.get_table(table_name)
-            rows = self._get_all_rows(table_name)
-            
-            for row in rows:
-                # Extract key from indexed columns
-                key_parts = []
-                for col_name in column_names:
-                    col_index = table_schema.column_index[col_name]
-                    key_parts.append(str(row.values[col_index]))
-                key = "_".join(key_parts)
-                
-                # Insert into index
-                self.index_manager.insert(index_name, key, row.row_id)
+            batch = self._get_all_rows(table_name)
+            positions = batch.positions()
+            keys = self._index_keys(batch, table_schema, column_names, positions)
+            row_ids = [batch.row_ids[p] for p in positions]
+            self.index_manager.insert_many(index_name, zip(keys, row_ids))
             
             return QueryResult(
                 success=True,
@@ -299,11 +551,12 @@ class QueryExecutor:
         except Exception as e:
             return QueryResult(
                 success=False,
-                message=f"Failed to create index '{index_name}': {str(e)}"
+                message=f"Failed to create index '{index_name}'", error=e
             )
     
     def _execute_drop_index(self, index_name: str) -> QueryResult:
         """Execute DROP INDEX query."""
+        self._invalidate_caches()
         try:
             self.index_manager.drop_index(index_name)
             return QueryResult(
@@ -314,115 +567,235 @@ class QueryExecutor:
         except Exception as e:
             return QueryResult(
                 success=False,
-                message=f"Failed to drop index '{index_name}': {str(e)}"
+                message=f"Failed to drop index '{index_name}'", error=e
             )
     
     # Helper methods
     
-    def _get_next_row_id(self, table_name: str) -> int:
-        """Get next row ID for a table (simple implementation)."""
-        # In a real implementation, this would use a sequence or auto-increment
-        rows = self._get_all_rows(table_name)
-        if not rows:
-            return 1
-        return max(row.row_id for row in rows) + 1
+    def _get_next_row_id(self, table_name: str, count: int = 1) -> int:
+        """Allocate count consecutive row IDs for a table, returning the first."""
+        row_id = self._next_row_id.get(table_name)
+        if row_id is None:
+            # Table was not created through this executor; continue after
+            # any rows already stored
+            store = self._get_store(table_name)
+            row_id = max(store.row_ids) + 1 if store is not None and store.row_ids else 1
+        self._next_row_id[table_name] = row_id + count
+        return row_id
     
-    def _store_row(self, table_name: str, row: Row) -> None:
+    def _store_row(self, table_name: str, row_id: int, values: Sequence[Any]) -> None:
         """Store a row (simple in-memory implementation)."""
         # For now, store in memory. Later we'll use the storage manager.
-        if not hasattr(self, '_table_data'):
-            self._table_data = {}
-        
-        if table_name not in self._table_data:
-            self._table_data[table_name] = []
+        store = self._get_or_create_store(table_name)
         
         # Check if row exists
-        for i, existing_row in enumerate(self._table_data[table_name]):
-            if existing_row.row_id == row.row_id:
-                self._table_data[table_name][i] = row
-                return
+        position = store.position(row_id)
+        if position >= 0:
+            store.set_row(position, values)
+            return
         
         # Add new row
-        self._table_data[table_name].append(row)
+        store.append(row_id, values)
     
-    def _get_all_rows(self, table_name: str) -> List[Row]:
-        """Get all rows from a table."""
-        if not hasattr(self, '_table_data'):
-            self._table_data = {}
-        
-        return self._table_data.get(table_name, [])
+    def _get_row(self, table_name: str, row_id: int) -> Optional[Row]:
+        """Get a stored row by ID, or None if it does not exist."""
+        store = self._get_store(table_name)
+        position = store.position(row_id) if store is not None else -1
+        if position < 0:
+            return None
+        return Row(row_id, tuple(store.get_row(position)))
+    
+    def _get_schema(self, table_name: str) -> Tuple[TableSchema, List[IndexSchema]]:
+        """Get a table's schema and indexes, cached until the next DDL."""
+        cached = self._schema_cache.get(table_name)
+        if cached is None:
+            cached = self._schema_cache[table_name] = (
+                self.catalog.get_table(table_name),
+                self.catalog.get_table_indexes(table_name),
+            )
+        return cached
+    
+    def _invalidate_caches(self) -> None:
+        """Drop cached schemas and plans after a DDL statement."""
+        self._plan_cache.clear()
+        self._schema_cache.clear()
+    
+    def _get_or_create_store(self, table_name: str) -> ColumnStore:
+        """Get the column store for a table, creating it on first insert."""
+        store = self._table_data.get(table_name)
+        if store is None:
+            columns = self._get_schema(table_name)[0].columns.values()
+            store = self._table_data[table_name] = ColumnStore(
+                len(columns),
+                [col.encoding == "dict" for col in columns],
+                [COLUMN_TYPECODES.get(col.data_type) for col in columns],
+            )
+        return store
+    
+    def _get_store(self, table_name: str) -> Optional[ColumnStore]:
+        """Get the column store holding a table's rows."""
+        return self._table_data.get(table_name)
     
-    def _delete_row(self, table_name: str, row: Row) -> None:
-        """Delete a row."""
-        if not hasattr(self, '_table_data'):
-            self._table_data = {}
+    def _get_all_rows(self, table_name: str) -> ColumnBatch:
+        """Get all rows from a table as a column batch."""
+        store = self._get_store(table_name)
+        if store is None:
+            column_count = len(self._get_schema(table_name)[0].column_names)
+            return ColumnBatch([[] for _ in range(column_count)], [])
         
-        if table_name in self._table_data:
-            self._table_data[table_name] = [
-                r for r in self._table_data[table_name] 
-                if r.row_id != row.row_id
-            ]
+        return store.batch()
     
-    def _apply_where_clause(self, rows: List[Row], table_schema: TableSchema,
-                           where_clause: Dict) -> List[Row]:
-        """Apply WHERE clause to filter rows."""
-        filtered_rows = []
+    def _apply_where_clause(self, batch: ColumnBatch, table_schema: TableSchema,
+                           where_clause: Dict, limit: Optional[int] = None) -> List[int]:
+        """Apply WHERE clause, returning the positions of matching rows.
         
-        for row in rows:
-            match = True
+        An equality on every column of a unique index is answered through
+        the index; otherwise the batch is scanned. With a limit, scanning
+        stops once that many matches are found.
+        """
+        candidates = self._index_lookup(table_schema, where_clause)
+        if candidates is not None:
+            # Re-check the whole clause on the candidate rows only
+            matches = self._scan_where(batch.take(candidates), table_schema,
+                                       where_clause, limit)
+            return [candidates[i] for i in matches]
+        return self._scan_where(batch, table_schema, where_clause, limit)
+    
+    def _index_lookup(self, table_schema: TableSchema,
+                      where_clause: Dict) -> Optional[List[int]]:
+        """Find the candidate position through a unique index, or None to scan."""
+        _, indexes = self._get_schema(table_schema.table_name)
+        for index in indexes:
+            if not index.is_unique or index.index_name not in self.index_manager.indexes:
+                continue
             
-            for col_name, condition in where_clause.items():
-                if col_name not in table_schema.column_index:
-                    match = False
+            parts = []
+            for col_name in index.column_names:
+                if col_name not in where_clause:
                     break
-                
-                col_index = table_schema.column_index[col_name]
-                value = row.values[col_index]
-                
-                # Simple equality condition for now
-                if isinstance(condition, tuple):
-                    # Handle operators: ('=', value), ('>', value), etc.
-                    op, expected = condition
-                    if op == '=' and value != expected:
-                        match = False
-                        break
-                    elif op == '!=' and value == expected:
-                        match = False
-                        break
-                    elif op == '>' and not (value > expected):
-                        match = False
-                        break
-                    elif op == '<' and not (value < expected):
-                        match = False
-                        break
-                    elif op == '>=' and not (value >= expected):
-                        match = False
-                        break
-                    elif op == '<=' and not (value <= expected):
-                        match = False
-                        break
-                else:
-                    # Simple equality
-                    if value != condition:
-                        match = False
-                        break
+                op, expected = _split_condition(where_clause[col_name])
+                # Index keys hold cast values; a literal of another type
+                # (e.g. 1.0 for an INTEGER) must go through the scan
+                col_type = table_schema.column_types[table_schema.column_index[col_name]]
+                if op != '=' or type(expected) is not col_type:
+                    break
+                parts.append(expected)
+            else:
+                key = parts[0] if len(parts) == 1 else tuple(parts)
+                row_id = self.index_manager.search(index.index_name, key)
+                store = self._get_store(table_schema.table_name)
+                if row_id is None or store is None:
+                    return []
+                position = store.position(row_id)
+                return [position] if position >= 0 else []
+        return None
+    
+    def _scan_where(self, batch: ColumnBatch, table_schema: TableSchema,
+                    where_clause: Dict, limit: Optional[int] = None) -> List[int]:
+        """Scan a batch for the positions of rows matching a WHERE clause."""
+        ops = []
+        args = []
+        for col_name, condition in where_clause.items():
+            if col_name not in table_schema.column_index:
+                # Unknown columns never match
+                return []
             
-            if match:
-                filtered_rows.append(row)
+            op, expected = _split_condition(condition)
+            if op not in _COMPARISON_OPS:
+                raise ValueError(f"Unsupported operator '{op}'")
+            
+            col_index = table_schema.column_index[col_name]
+            column = batch.columns[col_index]
+            encoding = batch.encodings[col_index]
+            if encoding is not None:
+                if op in ('=', '!='):
+                    # Compare codes; a literal not in the dictionary gets
+                    # -1, which no row has
+                    expected = encoding.code(expected)
+                else:
+                    column = map(encoding.values.__getitem__, column)
+            ops.append(op)
+            args.append(column)
+            args.append(expected)
         
-        return filtered_rows
+        if batch.live is not None and ops:
+            # Skip rows deleted since the last compaction
+            ops.append('!=')
+            args.append(batch.live)
+            args.append(0)
+        
+        if not ops:
+            positions = batch.positions()
+        elif limit is None:
+            return _compile_predicate(tuple(ops))(*args)
+        else:
+            positions = _compile_predicate(tuple(ops), lazy=True)(*args)
+        if limit is not None:
+            positions = itertools.islice(positions, max(limit, 0))
+        return list(positions)
+    
+    def _index_keys(self, batch: ColumnBatch, table_schema: TableSchema,
+                    column_names: List[str],
+                    positions: Optional[Sequence[int]] = None) -> List[Any]:
+        """Get the index keys of the rows at positions (default: all rows)."""
+        return _column_keys(batch.project(
+            [table_schema.column_index[col_name] for col_name in column_names], positions
+        ))
+    
+    def _index_key_type(self, table_schema: TableSchema,
+                        column_names: Sequence[str]) -> Optional[type]:
+        """Get the type of an index's keys, or None for composite keys."""
+        if len(column_names) != 1:
+            return None
+        return table_schema.column_types[table_schema.column_index[column_names[0]]]
+    
+    def _check_unique(self, plan: PreparedInsert, rows: List[List[Any]]) -> None:
+        """Raise if inserting rows would duplicate a key of a unique index."""
+        for index_name, keys in plan.index_batches(rows):
+            if index_name not in plan.unique_indexes:
+                continue
+            if len(set(keys)) < len(keys) or any(
+                self.index_manager.search(index_name, key) is not None for key in keys
+            ):
+                raise ValueError(f"Duplicate key for unique index '{index_name}'")
+    
+    def _index_changes(self, batch: ColumnBatch, table_schema: TableSchema,
+                       positions: Sequence[int],
+                       set_values: Dict[str, Any]) -> List[Tuple[str, List[Any], List[Any]]]:
+        """Get (index name, old keys, new keys) for an UPDATE of rows at positions.
+        
+        Only indexes over an assigned column are included. Raises if the
+        update would duplicate a key of a unique index.
+        """
+        _, indexes = self._get_schema(table_schema.table_name)
+        updated = {batch.row_ids[p] for p in positions}
+        changes = []
+        for index in indexes:
+            if not any(col_name in set_values for col_name in index.column_names):
+                continue
+            
+            key_columns = batch.project(
+                [table_schema.column_index[col_name] for col_name in index.column_names],
+                positions
+            )
+            new_keys = _column_keys([
+                itertools.repeat(set_values[col_name], len(positions))
+                if col_name in set_values else key_column
+                for col_name, key_column in zip(index.column_names, key_columns)
+            ])
+            if index.is_unique:
+                if len(set(new_keys)) < len(new_keys):
+                    raise ValueError(f"Duplicate key for unique index '{index.index_name}'")
+                for key in new_keys:
+                    row_id = self.index_manager.search(index.index_name, key)
+                    if row_id is not None and row_id not in updated:
+                        raise ValueError(f"Duplicate key for unique index '{index.index_name}'")
+            changes.append((index.index_name, _column_keys(key_columns), new_keys))
+        return changes
     
     def _update_indexes_for_row(self, table_name: str, row: Row) -> None:
         """Update all indexes for a row."""
-        table_schema = self.catalog.get_table(table_name)
+        plan = self._prepare_insert(table_name)
         
-        for index in self.catalog.get_table_indexes(table_name):
-            # Extract key from indexed columns
-            key_parts = []
-            for col_name in index.column_names:
-                col_index = table_schema.column_index[col_name]
-                key_parts.append(str(row.values[col_index]))
-            key = "_".join(key_parts)
-            
-            # Insert into index
-            self.index_manager.insert(index.index_name, key, row.row_id)
\ No newline at end of file
+        for index_name, key in plan.index_entries(row.values):
+            self.index_manager.insert(index_name, key, row.row_id)
\ No newline at end of file
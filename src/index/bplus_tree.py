@@ -4,39 +4,51 @@ A disk-based B+ tree for efficient range queries and point lookups.
 """
 import struct
 import math
-from typing import List, Tuple, Optional, Any, Iterator, Dict
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Tuple, Optional, Any, Iterator, Dict, Union
+from dataclasses import dataclass, field
 from enum import IntEnum
 
+# Added to int keys so signed values fit ">Q" in numeric order
+_INT_BIAS = 1 << 63
+_U64 = struct.Struct(">Q")
+
 class NodeType(IntEnum):
     """Types of B+ Tree nodes."""
     INTERNAL = 0
     LEAF = 1
 
-@dataclass
+@dataclass(frozen=True)
 class BPlusTreeConfig:
     """Configuration for B+ Tree."""
     order: int = 4  # Maximum number of keys in a node (min = ceil(order/2))
     key_size: int = 8  # Size of key in bytes (for fixed-size keys)
     value_size: int = 8  # Size of value (record pointer) in bytes
+    # Derived from order once; node capacity checks read them on every insert
+    max_keys: int = field(init=False)
+    min_keys: int = field(init=False)
     
-    @property
-    def max_keys(self):
-        return self.order - 1
-    
-    @property
-    def min_keys(self):
-        return math.ceil(self.order / 2) - 1
+    def __post_init__(self):
+        object.__setattr__(self, 'max_keys', self.order - 1)
+        object.__setattr__(self, 'min_keys', math.ceil(self.order / 2) - 1)
 
 class BPNode:
-    """A node in the B+ Tree."""
+    """A node in the B+ Tree.
+
+    children is a packed array of 64-bit ints rather than a list of int
+    objects, so a node's pointers sit in one contiguous buffer.
+    """
+
+    __slots__ = ('node_id', 'node_type', 'config', 'keys', 'children',
+                 'next_leaf', 'parent', 'dirty')
     
     def __init__(self, node_id: int, node_type: NodeType, config: BPlusTreeConfig):
         self.node_id = node_id
         self.node_type = node_type
         self.config = config
-        self.keys: List[bytes] = []  # Serialized keys
-        self.children: List[int] = []  # For internal: child node IDs, for leaf: record pointers
+        self.keys: List[Union[bytes, int]] = []  # Serialized keys
+        self.children = array('q')  # For internal: child node IDs, for leaf: record pointers
         self.next_leaf: Optional[int] = None  # Pointer to next leaf (for range scans)
         self.parent: Optional[int] = None
         self.dirty = False
@@ -57,10 +69,7 @@ class BPNode:
         if self.node_type != NodeType.LEAF:
             raise ValueError("insert_key_value can only be called on leaf nodes")
         
-        # Find insertion point
-        pos = 0
-        while pos < len(self.keys) and self.keys[pos] < key:
-            pos += 1
+        pos = bisect_left(self.keys, key)
         
         # Insert key and value
         self.keys.insert(pos, key)
@@ -74,10 +83,7 @@ class BPNode:
         if self.node_type != NodeType.INTERNAL:
             raise ValueError("insert_key_child can only be called on internal nodes")
         
-        # Find insertion point
-        pos = 0
-        while pos < len(self.keys) and self.keys[pos] < key:
-            pos += 1
+        pos = bisect_left(self.keys, key)
         
         # Insert key and child (child goes after key)
         self.keys.insert(pos, key)
@@ -148,20 +154,16 @@ class BPNode:
         Find position of key in node.
         Returns: (position, exact_match)
         """
-        for i, k in enumerate(self.keys):
-            if k == key:
-                return i, True
-            elif k > key:
-                return i, False
-        return len(self.keys), False
+        pos = bisect_left(self.keys, key)
+        return pos, pos < len(self.keys) and self.keys[pos] == key
     
     def get_child_for_key(self, key: bytes) -> int:
         """For internal nodes, get the child node to follow for a given key."""
         if self.node_type != NodeType.INTERNAL:
             raise ValueError("get_child_for_key can only be called on internal nodes")
         
-        pos, _ = self.find_key_position(key)
-        return self.children[pos]
+        # Keys equal to a separator live in the right subtree
+        return self.children[bisect_right(self.keys, key)]
 
 class BPlusTree:
     """Disk-based B+ Tree index."""
@@ -172,6 +174,9 @@ class BPlusTree:
         self.root_node_id = 0  # Start with root at node 0
         self.next_node_id = 1  # Next available node ID
         self.node_cache: Dict[int, BPNode] = {}
+        # 8-byte keys are held as the int they spell in big-endian, so node
+        # searches compare machine-word ints instead of bytes objects
+        self.int_keys = self.config.key_size == 8
         
         # Create initial root leaf node
         self._create_root_node()
@@ -275,6 +280,8 @@ class BPlusTree:
         # Assign ID to new leaf
         new_leaf.node_id = self.next_node_id
         self.next_node_id += 1
+        # split() linked the leaf to the placeholder ID
+        leaf.next_leaf = new_leaf.node_id
         
         # Save both leaves
         self._save_node(leaf)
@@ -339,7 +346,7 @@ class BPlusTree:
         
         # Set up root
         root.keys = [key]
-        root.children = [left_node.node_id, right_node_id]
+        root.children = array('q', (left_node.node_id, right_node_id))
         
         # Update children's parent pointers
         left_node.parent = root.node_id
@@ -366,28 +373,37 @@ class BPlusTree:
     
     def _get_node(self, node_id: int) -> BPNode:
         """Get node from cache (in-memory implementation)."""
-        if node_id not in self.node_cache:
+        node = self.node_cache.get(node_id)
+        if node is None:
             # For now, create a placeholder (in real implementation, load from disk)
             raise ValueError(f"Node {node_id} not found in cache")
-        return self.node_cache[node_id]
+        return node
     
     def _save_node(self, node: BPNode) -> None:
         """Save node to cache (in-memory implementation)."""
         self.node_cache[node.node_id] = node
     
-    def _serialize_key(self, key: Any) -> bytes:
-        """Serialize a key to bytes."""
+    def _serialize_key(self, key: Any) -> Union[bytes, int]:
+        """Serialize a key to bytes, or to an int for 8-byte keys."""
         if isinstance(key, int):
-            return struct.pack("<Q", key)  # 64-bit integer, little-endian
+            # 64-bit integer, big-endian and biased so bytes sort numerically
+            if self.int_keys:
+                return key + _INT_BIAS
+            return _U64.pack(key + _INT_BIAS)
         elif isinstance(key, str):
             # For strings, use UTF-8 encoding with fixed size
             encoded = key.encode('utf-8')
             # Pad or truncate to config.key_size
             if len(encoded) > self.config.key_size:
-                return encoded[:self.config.key_size]
+                encoded = encoded[:self.config.key_size]
             else:
-                return encoded.ljust(self.config.key_size, b'\x00')
+                encoded = encoded.ljust(self.config.key_size, b'\x00')
         elif isinstance(key, bytes):
-            return key
+            if not self.int_keys:
+                return key
+            encoded = key[:8].ljust(8, b'\x00')
         else:
-            raise TypeError(f"Unsupported key type: {type(key)}")
\ No newline at end of file
+            raise TypeError(f"Unsupported key type: {type(key)}")
+        if self.int_keys:
+            return int.from_bytes(encoded, 'big')
+        return encoded
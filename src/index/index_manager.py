@@ -1,8 +1,13 @@
 """
 Index manager for the database.
 """
-from typing import Dict, Any, Optional, List
-from .simple_bplus_tree import SimpleBPlusTree
+from typing import Dict, Any, Optional, List, Iterable, Tuple, Type
+from .simple_bplus_tree import SimpleBPlusTree, IntSimpleBPlusTree
+
+# Tree specialized for an index's key type; other types use SimpleBPlusTree
+_TREE_CLASSES: Dict[type, Type[SimpleBPlusTree]] = {
+    int: IntSimpleBPlusTree,
+}
 
 class IndexManager:
     """Manages all indexes in the database."""
@@ -11,49 +16,60 @@ class IndexManager:
         self.indexes: Dict[str, SimpleBPlusTree] = {}
         self.index_counter = 0
     
-    def create_index(self, index_name: str, is_unique: bool = False) -> str:
-        """Create a new index."""
+    def create_index(self, index_name: str, is_unique: bool = False,
+                     key_type: Optional[type] = None) -> str:
+        """Create a new index, specialized when every key is of key_type."""
         if index_name in self.indexes:
             raise ValueError(f"Index '{index_name}' already exists")
         
-        tree = SimpleBPlusTree(order=4)
+        tree = _TREE_CLASSES.get(key_type, SimpleBPlusTree)(order=4)
         self.indexes[index_name] = tree
         return index_name
     
     def drop_index(self, index_name: str) -> None:
         """Drop an index."""
-        if index_name not in self.indexes:
+        if self.indexes.pop(index_name, None) is None:
             raise ValueError(f"Index '{index_name}' does not exist")
-        
-        del self.indexes[index_name]
     
     def insert(self, index_name: str, key: Any, value: Any) -> None:
         """Insert a key-value pair into an index."""
-        if index_name not in self.indexes:
+        tree = self.indexes.get(index_name)
+        if tree is None:
+            raise ValueError(f"Index '{index_name}' does not exist")
+        
+        tree.insert(key, value)
+    
+    def insert_many(self, index_name: str, entries: Iterable[Tuple[Any, Any]]) -> None:
+        """Insert many key-value pairs into an index."""
+        tree = self.indexes.get(index_name)
+        if tree is None:
             raise ValueError(f"Index '{index_name}' does not exist")
         
-        self.indexes[index_name].insert(key, value)
+        tree.bulk_load(entries)
     
     def search(self, index_name: str, key: Any) -> Optional[Any]:
         """Search for a key in an index."""
-        if index_name not in self.indexes:
+        tree = self.indexes.get(index_name)
+        if tree is None:
             raise ValueError(f"Index '{index_name}' does not exist")
         
-        return self.indexes[index_name].search(key)
+        return tree.search(key)
     
     def delete(self, index_name: str, key: Any) -> bool:
         """Delete a key from an index."""
-        if index_name not in self.indexes:
+        tree = self.indexes.get(index_name)
+        if tree is None:
             raise ValueError(f"Index '{index_name}' does not exist")
         
-        return self.indexes[index_name].delete(key)
+        return tree.delete(key)
     
     def range_search(self, index_name: str, start_key: Any, end_key: Any) -> List[Any]:
         """Search for keys in range in an index."""
-        if index_name not in self.indexes:
+        tree = self.indexes.get(index_name)
+        if tree is None:
             raise ValueError(f"Index '{index_name}' does not exist")
         
-        return self.indexes[index_name].range_search(start_key, end_key)
+        return tree.range_search(start_key, end_key)
     
     def get_all_indexes(self) -> List[str]:
         """Get all index names."""
@@ -3,58 +3,126 @@
 Finalized Simple B+ Tree implementation.
 Fixes range search comparisons and basic leaf deletion.
 """
+import functools
 import struct
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from operator import itemgetter
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Any, Iterable, Tuple
+
+# Added to int keys so signed values fit ">Q" in numeric order
+_INT_BIAS = 1 << 63
+# Precompiled so int keys skip struct's format-string cache lookup
+_U64 = struct.Struct(">Q")
+
+def _serialize(key: Any) -> bytes:
+    # Using Big-Endian (">Q") ensures byte-comparison matches numeric comparison;
+    # the bias maps negative ints below non-negative ones
+    if isinstance(key, int): return _U64.pack(key + _INT_BIAS)
+    if isinstance(key, str): return key.encode('utf-8')
+    if isinstance(key, tuple): return _serialize_composite(key)
+    return str(key).encode('utf-8')
+
+# Composite keys cost a join per call; the same ones recur across lookups and
+# index maintenance, so keep recent results. Scalars pack faster than a cache hit.
+def _serialize_composite(key: tuple) -> bytes:
+    # (1, 'x'), (1.0, 'x') and (True, 'x') are equal tuples that serialize
+    # differently, so the part types are part of the cache key
+    return _serialize_parts(key, tuple(map(type, key)))
+
+@functools.lru_cache(maxsize=4096)
+def _serialize_parts(key: tuple, types: tuple) -> bytes:
+    # Ints are fixed width, other parts are NUL-terminated so ("a", 2) sorts
+    # before ("ab", 1)
+    return b"".join(
+        _serialize(part) if isinstance(part, int) else _serialize(part) + b"\x00"
+        for part in key
+    )
 
-@dataclass
 class TreeNode:
-    keys: List[bytes]
-    values: List[Any]
-    children: Optional[List['TreeNode']] = None
-    next_leaf: Optional['TreeNode'] = None
-    is_leaf: bool = True
-    
-    def __post_init__(self):
-        if self.children is None and not self.is_leaf:
-            self.children = []
+    """A tree node. Internal nodes are always given their children list."""
+
+    __slots__ = ('keys', 'values', 'children', 'next_leaf', 'is_leaf', 'parent')
+
+    def __init__(self, keys: List[bytes], values: List[Any],
+                 children: Optional[List['TreeNode']] = None,
+                 next_leaf: Optional['TreeNode'] = None, is_leaf: bool = True):
+        self.keys = keys
+        self.values = values
+        self.children = children
+        self.next_leaf = next_leaf
+        self.is_leaf = is_leaf
+        self.parent: Optional[TreeNode] = None
 
 class SimpleBPlusTree:
     def __init__(self, order: int = 4):
         self.order = order
         self.root = TreeNode(keys=[], values=[], is_leaf=True)
-        self.key_to_value: Dict[bytes, Any] = {}
     
-    def _serialize_key(self, key: Any) -> bytes:
-        # Using Big-Endian (">Q") ensures byte-comparison matches numeric comparison
-        if isinstance(key, int): return struct.pack(">Q", key)
-        if isinstance(key, str): return key.encode('utf-8')
-        return str(key).encode('utf-8')
+    _serialize_key = staticmethod(_serialize)
 
     def _deserialize_key(self, key_bytes: bytes) -> Any:
-        try: return struct.unpack(">Q", key_bytes)[0]
+        try: return _U64.unpack(key_bytes)[0] - _INT_BIAS
         except: return key_bytes.decode('utf-8', errors='ignore')
 
     def insert(self, key: Any, value: Any) -> None:
         key_bytes = self._serialize_key(key)
-        self.key_to_value[key_bytes] = value
         leaf = self._find_leaf(self.root, key_bytes)
         self._insert_into_leaf(leaf, key_bytes, value)
         if len(leaf.keys) >= self.order:
             self._split_leaf(leaf)
 
+    def bulk_load(self, items: Iterable[Tuple[Any, Any]]) -> None:
+        """Insert many key-value pairs; an empty tree is built bottom-up.
+
+        Sorted entries are packed into full leaves and each internal level
+        is built from the one below, with no splits. A tree that already
+        has keys falls back to one insert per pair.
+        """
+        if self.root.keys or not self.root.is_leaf:
+            for key, value in items:
+                self.insert(key, value)
+            return
+
+        serialize = self._serialize_key
+        entries = sorted(((serialize(k), v) for k, v in items), key=itemgetter(0))
+        if not entries:
+            return
+        keys = [k for k, _ in entries]
+        values = [v for _, v in entries]
+
+        # Each level is a list of (node, smallest key in its subtree)
+        level = []
+        step = self.order - 1
+        prev = None
+        for i in range(0, len(keys), step):
+            leaf = TreeNode(keys=keys[i:i + step], values=values[i:i + step])
+            if prev is not None:
+                prev.next_leaf = leaf
+            prev = leaf
+            level.append((leaf, leaf.keys[0]))
+
+        while len(level) > 1:
+            groups = [level[i:i + self.order] for i in range(0, len(level), self.order)]
+            if len(groups[-1]) == 1:
+                # Give the last node a sibling rather than leave it without keys
+                groups[-1].insert(0, groups[-2].pop())
+            level = []
+            for group in groups:
+                children = [child for child, _ in group]
+                node = TreeNode(keys=[low for _, low in group[1:]], values=[],
+                                children=children, is_leaf=False)
+                for child in children:
+                    child.parent = node
+                level.append((node, group[0][1]))
+        self.root = level[0][0]
+
     def _find_leaf(self, node: TreeNode, key_bytes: bytes) -> TreeNode:
-        if node.is_leaf:
-            return node
-        idx = 0
-        while idx < len(node.keys) and key_bytes >= node.keys[idx]:
-            idx += 1
-        return self._find_leaf(node.children[idx], key_bytes)
+        while not node.is_leaf:
+            node = node.children[bisect_right(node.keys, key_bytes)]
+        return node
 
     def _insert_into_leaf(self, leaf: TreeNode, key: bytes, value: Any):
-        idx = 0
-        while idx < len(leaf.keys) and leaf.keys[idx] < key:
-            idx += 1
+        idx = bisect_left(leaf.keys, key)
         leaf.keys.insert(idx, key)
         leaf.values.insert(idx, value)
 
@@ -64,20 +132,20 @@ class SimpleBPlusTree:
         new_leaf = TreeNode(keys=leaf.keys[mid:], values=leaf.values[mid:], 
                             is_leaf=True, next_leaf=leaf.next_leaf)
         leaf.keys, leaf.values, leaf.next_leaf = leaf.keys[:mid], leaf.values[:mid], new_leaf
-        parent = self._find_parent(self.root, leaf)
+        parent = leaf.parent
         if parent is None:
-            new_root = TreeNode(keys=[promote_key], values=[], is_leaf=False)
-            new_root.children = [leaf, new_leaf]
+            new_root = TreeNode(keys=[promote_key], values=[], is_leaf=False,
+                                children=[leaf, new_leaf])
+            leaf.parent = new_leaf.parent = new_root
             self.root = new_root
         else:
             self._insert_into_internal(parent, promote_key, leaf, new_leaf)
 
     def _insert_into_internal(self, parent: TreeNode, key: bytes, left: TreeNode, right: TreeNode):
-        idx = 0
-        while idx < len(parent.keys) and parent.keys[idx] < key:
-            idx += 1
+        idx = bisect_left(parent.keys, key)
         parent.keys.insert(idx, key)
         parent.children.insert(idx + 1, right)
+        right.parent = parent
         if len(parent.keys) >= self.order:
             self._split_internal(parent)
 
@@ -87,27 +155,23 @@ class SimpleBPlusTree:
         new_node = TreeNode(keys=node.keys[mid+1:], values=[], is_leaf=False, 
                             children=node.children[mid+1:])
         node.keys, node.children = node.keys[:mid], node.children[:mid+1]
-        parent = self._find_parent(self.root, node)
+        for child in new_node.children:
+            child.parent = new_node
+        parent = node.parent
         if parent is None:
-            new_root = TreeNode(keys=[promote_key], values=[], is_leaf=False)
-            new_root.children = [node, new_node]
+            new_root = TreeNode(keys=[promote_key], values=[], is_leaf=False,
+                                children=[node, new_node])
+            node.parent = new_node.parent = new_root
             self.root = new_root
         else:
             self._insert_into_internal(parent, promote_key, node, new_node)
 
-    def _find_parent(self, root: TreeNode, target: TreeNode) -> Optional[TreeNode]:
-        if root.is_leaf: return None
-        if target in root.children: return root
-        for child in root.children:
-            p = self._find_parent(child, target)
-            if p: return p
-        return None
-
     def search(self, key: Any) -> Optional[Any]:
         key_bytes = self._serialize_key(key)
         leaf = self._find_leaf(self.root, key_bytes)
-        for i, k in enumerate(leaf.keys):
-            if k == key_bytes: return leaf.values[i]
+        i = bisect_left(leaf.keys, key_bytes)
+        if i < len(leaf.keys) and leaf.keys[i] == key_bytes:
+            return leaf.values[i]
         return None
 
     def range_search(self, start_key: Any, end_key: Any) -> List[Any]:
@@ -115,24 +179,38 @@ class SimpleBPlusTree:
         end_bytes = self._serialize_key(end_key)
         leaf = self._find_leaf(self.root, start_bytes)
         res = []
+        lo = bisect_left(leaf.keys, start_bytes)
         while leaf:
-            for i, k in enumerate(leaf.keys):
-                if start_bytes <= k < end_bytes: res.append(leaf.values[i])
-                elif k >= end_bytes: return res
-            leaf = leaf.next_leaf
+            hi = bisect_left(leaf.keys, end_bytes, lo)
+            res.extend(leaf.values[lo:hi])
+            if hi < len(leaf.keys): return res
+            leaf, lo = leaf.next_leaf, 0
         return res
 
     def delete(self, key: Any) -> bool:
-        """Deletes key from both the map and the tree structure."""
+        """Deletes one entry for key from its leaf."""
         key_bytes = self._serialize_key(key)
-        found_in_map = key_bytes in self.key_to_value
-        if found_in_map:
-            del self.key_to_value[key_bytes]
-            # Actual tree deletion
-            leaf = self._find_leaf(self.root, key_bytes)
-            for i, k in enumerate(leaf.keys):
-                if k == key_bytes:
-                    leaf.keys.pop(i)
-                    leaf.values.pop(i)
-                    return True
-        return False
\ No newline at end of file
+        leaf = self._find_leaf(self.root, key_bytes)
+        i = bisect_left(leaf.keys, key_bytes)
+        if i < len(leaf.keys) and leaf.keys[i] == key_bytes:
+            leaf.keys.pop(i)
+            leaf.values.pop(i)
+            return True
+        return False
+
+# Sorts below every int key, so NULLs in an int index come first
+_NULL_INT_KEY = float('-inf')
+
+class IntSimpleBPlusTree(SimpleBPlusTree):
+    """SimpleBPlusTree for single INTEGER or BIGINT columns.
+
+    Keys are kept as the ints themselves: no per-call type dispatch or
+    packing, and node searches compare ints.
+    """
+
+    @staticmethod
+    def _serialize_key(key: Any) -> Any:
+        return _NULL_INT_KEY if key is None else key
+
+    def _deserialize_key(self, key: Any) -> Any:
+        return None if key == _NULL_INT_KEY else key
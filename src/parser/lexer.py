@@ -2,7 +2,8 @@
 SQL Lexer - converts SQL strings into tokens.
 """
 from enum import Enum
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
+import mmap
 import re
 
 class TokenType(Enum):
@@ -85,6 +86,8 @@ class TokenType(Enum):
 class Token:
     """A single token with type and value."""
     
+    __slots__ = ('type', 'value', 'line', 'column')
+    
     def __init__(self, token_type: TokenType, value: str = "", 
                  line: int = 0, column: int = 0):
         self.type = token_type
@@ -104,150 +107,122 @@ class Token:
             return self.type == other
         return False
 
+# Token types that are not keywords despite having alphabetic values
+_NON_KEYWORDS = {TokenType.IDENTIFIER, TokenType.STRING, TokenType.NUMBER, TokenType.EOF}
+
+# Keywords and data type names by their upper-case spelling
+_KEYWORDS = {
+    t.value: t for t in TokenType if t.value.isalpha() and t not in _NON_KEYWORDS
+}
+
+# Operators and punctuation by their spelling ('*' is MULTIPLY; STAR is an alias)
+_OPERATORS = {t.value: t for t in TokenType if not t.value.isalpha()}
+
+# One alternation for every token; the matching group names the kind. Longer
+# operators come first so '<=' is not read as '<' followed by '='.
+_TOKEN_PATTERN = r"""
+    (?P<WS>\s+)
+  | (?P<STRING>"[^"]*"|'[^']*')
+  | (?P<NUMBER>\d+\.\d+|\d+)
+  | (?P<OP><=|>=|!=|[=<>+\-*/,.;()])
+  | (?P<WORD>[a-zA-Z_][a-zA-Z0-9_]*)
+"""
+_TOKEN_RE = re.compile(_TOKEN_PATTERN, re.VERBOSE)
+# Same tokens over UTF-8 bytes, for scripts lexed straight from a mapped file
+_TOKEN_RE_BYTES = re.compile(_TOKEN_PATTERN.encode(), re.VERBOSE)
+
 class SQLLexer:
     """Lexical analyzer for SQL statements."""
     
-    # Regex patterns for tokens
-    PATTERNS = [
-        # Keywords (case-insensitive)
-        (r'(?i)SELECT', TokenType.SELECT),
-        (r'(?i)FROM', TokenType.FROM),
-        (r'(?i)WHERE', TokenType.WHERE),
-        (r'(?i)INSERT', TokenType.INSERT),
-        (r'(?i)INTO', TokenType.INTO),
-        (r'(?i)VALUES', TokenType.VALUES),
-        (r'(?i)UPDATE', TokenType.UPDATE),
-        (r'(?i)SET', TokenType.SET),
-        (r'(?i)DELETE', TokenType.DELETE),
-        (r'(?i)CREATE', TokenType.CREATE),
-        (r'(?i)TABLE', TokenType.TABLE),
-        (r'(?i)DROP', TokenType.DROP),
-        (r'(?i)INDEX', TokenType.INDEX),
-        (r'(?i)PRIMARY', TokenType.PRIMARY),
-        (r'(?i)KEY', TokenType.KEY),
-        (r'(?i)UNIQUE', TokenType.UNIQUE),
-        (r'(?i)NOT', TokenType.NOT),
-        (r'(?i)NULL', TokenType.NULL),
-        (r'(?i)AND', TokenType.AND),
-        (r'(?i)OR', TokenType.OR),
-        (r'(?i)ORDER', TokenType.ORDER),
-        (r'(?i)BY', TokenType.BY),
-        (r'(?i)ASC', TokenType.ASC),
-        (r'(?i)DESC', TokenType.DESC),
-        (r'(?i)LIMIT', TokenType.LIMIT),
-        (r'(?i)JOIN', TokenType.JOIN),
-        (r'(?i)INNER', TokenType.INNER),
-        (r'(?i)LEFT', TokenType.LEFT),
-        (r'(?i)RIGHT', TokenType.RIGHT),
-        (r'(?i)ON', TokenType.ON),
-        (r'(?i)BEGIN', TokenType.BEGIN),
-        (r'(?i)COMMIT', TokenType.COMMIT),
-        (r'(?i)ROLLBACK', TokenType.ROLLBACK),
-        (r'(?i)TRANSACTION', TokenType.TRANSACTION),
-        
-        # Data types
-        (r'(?i)INTEGER', TokenType.INTEGER),
-        (r'(?i)BIGINT', TokenType.BIGINT),
-        (r'(?i)VARCHAR', TokenType.VARCHAR),
-        (r'(?i)TEXT', TokenType.TEXT),
-        (r'(?i)FLOAT', TokenType.FLOAT),
-        (r'(?i)DOUBLE', TokenType.DOUBLE),
-        (r'(?i)BOOLEAN', TokenType.BOOLEAN),
-        (r'(?i)DATE', TokenType.DATE),
-        (r'(?i)TIMESTAMP', TokenType.TIMESTAMP),
-        
-        # Operators
-        (r'=', TokenType.EQUALS),
-        (r'!=', TokenType.NOT_EQUALS),
-        (r'<', TokenType.LESS_THAN),
-        (r'>', TokenType.GREATER_THAN),
-        (r'<=', TokenType.LESS_EQUALS),
-        (r'>=', TokenType.GREATER_EQUALS),
-        (r'\+', TokenType.PLUS),
-        (r'-', TokenType.MINUS),
-        (r'\*', TokenType.MULTIPLY),
-        (r'/', TokenType.DIVIDE),
-        
-        # Punctuation
-        (r',', TokenType.COMMA),
-        (r'\.', TokenType.DOT),
-        (r';', TokenType.SEMICOLON),
-        (r'\(', TokenType.LPAREN),
-        (r'\)', TokenType.RPAREN),
-        
-        # Literals
-        (r'"[^"]*"', TokenType.STRING),  # Double quoted strings
-        (r"'[^']*'", TokenType.STRING),  # Single quoted strings
-        (r'\d+\.\d+', TokenType.NUMBER),  # Floating point
-        (r'\d+', TokenType.NUMBER),       # Integers
-        
-        # Identifiers
-        (r'[a-zA-Z_][a-zA-Z0-9_]*', TokenType.IDENTIFIER),
-        
-        # Whitespace (ignored)
-        (r'\s+', None),
-    ]
-    
-    def __init__(self, sql: str):
+    def __init__(self, sql: Union[str, bytes, mmap.mmap]):
         self.sql = sql
+        self.token_re = _TOKEN_RE if isinstance(sql, str) else _TOKEN_RE_BYTES
         self.position = 0
         self.line = 1
         self.column = 1
         self.tokens: List[Token] = []
     
+    @classmethod
+    def from_file(cls, path: str) -> 'SQLLexer':
+        """Create a lexer over a UTF-8 SQL script without reading it into memory.
+
+        Positions are byte offsets into the file; lines and columns still
+        count characters. Close the lexer (or use it in a with block) to
+        release the mapping.
+        """
+        with open(path, 'rb') as f:
+            try:
+                sql = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty files cannot be mapped
+                sql = b""
+        return cls(sql)
+    
+    def close(self) -> None:
+        """Release the file mapping of a lexer created by from_file."""
+        if isinstance(self.sql, mmap.mmap):
+            self.sql.close()
+    
+    def __enter__(self) -> 'SQLLexer':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def tokenize(self) -> List[Token]:
-        """Convert SQL string to tokens."""
-        while self.position < len(self.sql):
-            token = self._next_token()
-            if token:
-                self.tokens.append(token)
+        """Convert SQL string to tokens.
         
-        # Add EOF token
-        self.tokens.append(Token(TokenType.EOF, "", self.line, self.column))
-        return self.tokens
-    
-    def _next_token(self) -> Optional[Token]:
-        """Get the next token from input."""
-        remaining = self.sql[self.position:]
+        The token regex is iterated once over the whole input; a gap between
+        one match and the next is an unexpected character.
+        """
+        sql = self.sql
+        tokens = self.tokens
+        position, line, column = self.position, self.line, self.column
         
-        for pattern, token_type in self.PATTERNS:
-            match = re.match(pattern, remaining)
-            if match:
-                value = match.group(0)
-                start = self.position
-                
-                # Update position
-                self.position += len(value)
-                
-                # Update line and column
-                lines = value.count('\n')
-                if lines > 0:
-                    self.line += lines
-                    last_newline = value.rfind('\n')
-                    self.column = len(value) - last_newline
-                else:
-                    self.column += len(value)
-                
-                # Skip whitespace tokens
-                if token_type is None:
-                    return None
-                
-                # Handle string literals (remove quotes)
-                if token_type == TokenType.STRING:
-                    value = value[1:-1]  # Remove surrounding quotes
-                
-                # Handle identifiers vs keywords
-                if token_type == TokenType.IDENTIFIER:
-                    # Check if it's actually a keyword
-                    upper_value = value.upper()
-                    for kw_pattern, kw_type in self.PATTERNS:
-                        if kw_type and kw_type != TokenType.IDENTIFIER:
-                            kw_name = kw_pattern.replace(r'(?i)', '').replace('\\', '')
-                            if kw_name.upper() == upper_value:
-                                token_type = kw_type
-                                break
-                
-                return Token(token_type, value, self.line - lines, self.column - len(value))
+        for match in self.token_re.finditer(sql, position):
+            if match.start() != position:
+                break
+            
+            kind = match.lastgroup
+            value = match.group()
+            if not isinstance(value, str):
+                value = value.decode('utf-8')
+            start_line, start_column = line, column
+            
+            # Update position, line and column
+            position = match.end()
+            lines = value.count('\n')
+            if lines > 0:
+                line += lines
+                column = len(value) - value.rfind('\n')
+            else:
+                column += len(value)
+            
+            # Skip whitespace
+            if kind == 'WS':
+                continue
+            
+            if kind == 'WORD':
+                token_type = _KEYWORDS.get(value.upper(), TokenType.IDENTIFIER)
+            elif kind == 'OP':
+                token_type = _OPERATORS[value]
+            elif kind == 'STRING':
+                token_type = TokenType.STRING
+                value = value[1:-1]  # Remove surrounding quotes
+            else:
+                token_type = TokenType.NUMBER
+            
+            tokens.append(Token(token_type, value, start_line, start_column))
         
-        # No pattern matched - syntax error
-        raise SyntaxError(f"Unexpected character '{remaining[0]}' at line {self.line}, column {self.column}")
\ No newline at end of file
+        self.position, self.line, self.column = position, line, column
+        if position < len(sql):
+            char = sql[position:position + 1]
+            if not isinstance(char, str):
+                char = char.decode('utf-8', errors='replace')
+            raise SyntaxError(
+                f"Unexpected character '{char}' "
+                f"at line {line}, column {column}"
+            )
+        
+        # Add EOF token
+        tokens.append(Token(TokenType.EOF, "", line, column))
+        return tokens
@@ -1,65 +1,346 @@
 """
 Simple SQL interface to convert SQL strings to QueryExecutor calls.
 """
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable, Sequence
+from collections import OrderedDict
 from enum import Enum
 import re
+import sys
+import threading
 
 from ..executor.query_executor import QueryExecutor, QueryType, QueryResult
 from ..catalog.schema import ColumnSchema, DataType, ColumnConstraint
 
+# A parsed statement: the query type plus the keyword arguments for
+# QueryExecutor.execute
+Plan = Tuple[QueryType, Dict[str, Any]]
+
+# A cached statement template: the query type plus a function that builds
+# fresh kwargs from the template's literal or parameter values
+CompiledPlan = Tuple[QueryType, Callable[[Sequence[Any]], Dict[str, Any]]]
+
+# Statements whose literals are stripped out before parsing, so that every
+# statement of the same shape shares one cached parse
+TEMPLATE_PREFIXES = ('INSERT INTO', 'SELECT', 'UPDATE', 'DELETE FROM')
+_TEMPLATE_PREFIX_LENGTH = max(map(len, TEMPLATE_PREFIXES))
+
+# Quoted strings and numeric literals
+LITERAL_PATTERN = re.compile(
+    r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|(?<![\w.?])-?\d+(?:\.\d+)?(?![\w.])"""
+)
+
+# Quoted strings (skipped) and '?' parameter markers in prepared statements
+PARAM_PATTERN = re.compile(r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|\?""")
+
+# Statement patterns, compiled once rather than looked up in re's cache per call
+_FLAGS = re.IGNORECASE | re.DOTALL
+CREATE_TABLE_PATTERN = re.compile(r'CREATE TABLE (\w+)\s*\((.*)\)', _FLAGS)
+INSERT_PATTERN = re.compile(
+    r'INSERT INTO (\w+)\s*(?:\(([^)]+)\))?\s*VALUES\s*\(([^)]+)\)', _FLAGS
+)
+SELECT_PATTERN = re.compile(
+    r'SELECT\s+(.+?)\s+FROM\s+(\w+)(?:\s+WHERE\s+(.+?))?(?:\s+LIMIT\s+(\d+|\?\d+))?\s*$',
+    _FLAGS
+)
+UPDATE_PATTERN = re.compile(r'UPDATE\s+(\w+)\s+SET\s+(.+?)(?:\s+WHERE\s+(.+))?\s*$', _FLAGS)
+DELETE_PATTERN = re.compile(r'DELETE FROM\s+(\w+)(?:\s+WHERE\s+(.+))?', _FLAGS)
+DROP_TABLE_PATTERN = re.compile(r'DROP TABLE\s+(\w+)', re.IGNORECASE)
+CREATE_INDEX_PATTERN = re.compile(
+    r'CREATE INDEX\s+(\w+)\s+ON\s+(\w+)\s*\(([^)]+)\)', _FLAGS
+)
+DROP_INDEX_PATTERN = re.compile(r'DROP INDEX\s+(\w+)', re.IGNORECASE)
+
+# Quoted strings (skipped) and the AND/OR keywords between WHERE conditions
+WHERE_SEPARATOR_PATTERN = re.compile(
+    r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|\s+(AND|OR)\s+""", re.IGNORECASE
+)
+
+# A whole WHERE condition: column, comparison operator and a single value.
+# Two-character operators are tried before '=', '<' and '>'.
+WHERE_PATTERN = re.compile(
+    r"""\s*([\w.]+)\s*(!=|>=|<=|=|>|<)\s*('(?:[^']|'')*'|"(?:[^"]|"")*"|[^\s'"]+)\s*"""
+)
+
+# Unquoted words that stand for a value
+KEYWORD_VALUES: Dict[str, Any] = {'TRUE': True, 'FALSE': False, 'NULL': None}
+
+# Column type names accepted in CREATE TABLE
+TYPE_NAMES: Dict[str, DataType] = {
+    'INTEGER': DataType.INTEGER,
+    'INT': DataType.INTEGER,
+    'BIGINT': DataType.BIGINT,
+    'VARCHAR': DataType.VARCHAR,
+    'TEXT': DataType.TEXT,
+    'STRING': DataType.TEXT,
+    'FLOAT': DataType.FLOAT,
+    'DOUBLE': DataType.DOUBLE,
+    'BOOLEAN': DataType.BOOLEAN,
+    'BOOL': DataType.BOOLEAN,
+    'DATE': DataType.DATE,
+    'TIMESTAMP': DataType.TIMESTAMP,
+}
+
+# One comma-separated item of a VALUES list or SET clause: quoted strings
+# (which may contain commas) and other characters up to the next comma.
+# A lone quote is kept as an ordinary character. Runs of plain characters
+# are matched possessively, so the engine never backtracks into them.
+LIST_ITEM_PATTERN = re.compile(r"""(?:[^,'"]++|'(?:[^']|'')*'|"(?:[^"]|"")*"|['"])+""")
+
+# One column definition of CREATE TABLE: as LIST_ITEM_PATTERN, but commas
+# inside parentheses (up to two levels, as in DECIMAL(10,2)) do not split
+COLUMN_DEF_PATTERN = re.compile(
+    r"""(?:[^,'"()]++|'(?:[^']|'')*'|"(?:[^"]|"")*"|\((?:[^()]|\([^()]*\))*\)|['"()])+"""
+)
+
+# One statement of a script: everything up to the next ';' outside quotes
+STATEMENT_PATTERN = re.compile(r"""(?:[^;'"]++|'(?:[^']|'')*'|"(?:[^"]|"")*"|['"])+""")
+
+class _Placeholder:
+    """Marks the position of a stripped literal inside a cached plan."""
+    
+    __slots__ = ('index',)
+    
+    def __init__(self, index: int):
+        self.index = index
+
+def _compile_binder(value: Any) -> Callable[[Sequence[Any]], Any]:
+    """Generate a function that copies a cached plan value, substituting
+    placeholders with the values passed to it.
+    
+    The copy is written out as a single expression for the value's shape,
+    so binding does no per-item type checks or recursion.
+    """
+    constants: List[Any] = []
+    
+    def emit(v: Any) -> str:
+        if isinstance(v, _Placeholder):
+            return f"p[{v.index}]"
+        if isinstance(v, list):
+            return f"[{', '.join(map(emit, v))}]"
+        if isinstance(v, tuple):
+            return f"({''.join(emit(item) + ', ' for item in v)})"
+        if isinstance(v, dict):
+            return "{" + ", ".join(f"{emit(k)}: {emit(item)}" for k, item in v.items()) + "}"
+        constants.append(v)
+        return f"c[{len(constants) - 1}]"
+    
+    return eval(f"lambda p: {emit(value)}", {"c": constants})
+
+class ParseCache:
+    """Thread-safe LRU cache of parsed statement templates."""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, parse: Callable[[str], Any]) -> Any:
+        """Return the cached parse of key, calling parse(key) on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        
+        # Parse outside the lock; a concurrent miss on the same key just
+        # parses twice and stores an equivalent plan
+        value = parse(key)
+        
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+    
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Failed results for malformed statements. They carry no per-statement
+# detail, so one shared instance of each is returned.
+_INVALID_CREATE_TABLE = QueryResult(success=False, message="Invalid CREATE TABLE syntax")
+_NO_COLUMNS = QueryResult(success=False, message="No valid columns found in CREATE TABLE")
+_INVALID_INSERT = QueryResult(success=False, message="Invalid INSERT syntax")
+_INVALID_SELECT = QueryResult(success=False, message="Invalid SELECT syntax")
+_INVALID_UPDATE = QueryResult(success=False, message="Invalid UPDATE syntax")
+_INVALID_DELETE = QueryResult(success=False, message="Invalid DELETE syntax")
+_INVALID_DROP_TABLE = QueryResult(success=False, message="Invalid DROP TABLE syntax")
+_INVALID_CREATE_INDEX = QueryResult(success=False, message="Invalid CREATE INDEX syntax")
+_INVALID_DROP_INDEX = QueryResult(success=False, message="Invalid DROP INDEX syntax")
+_UNSUPPORTED_WHERE = QueryResult(
+    success=False,
+    message="Unsupported WHERE clause: expected column comparisons joined by AND"
+)
+
 class SimpleSQLParser:
     """Simple SQL parser for basic SQL operations."""
     
     def __init__(self, query_executor: QueryExecutor):
         self.executor = query_executor
+        # Parsed plans keyed on the literal-stripped statement template
+        self.parse_cache = ParseCache()
+        # Exact statement text -> (template plan, literal values), or None
+        # for statements that are not templated
+        self._statement_cache = ParseCache()
+        # Statement parsers by leading keyword; CREATE and DROP also take
+        # the second keyword
+        self._parsers: Dict[str, Callable[[str], Union[Plan, QueryResult]]] = {
+            'CREATE TABLE': self._parse_create_table,
+            'INSERT': self._parse_insert,
+            'SELECT': self._parse_select,
+            'UPDATE': self._parse_update,
+            'DELETE': self._parse_delete,
+            'DROP TABLE': self._parse_drop_table,
+            'CREATE INDEX': self._parse_create_index,
+            'DROP INDEX': self._parse_drop_index,
+        }
+        # Prepared statements keyed on their '?'-parameterized text
+        self._prepared_cache = ParseCache()
     
     def parse_execute(self, sql: str) -> QueryResult:
         """Parse and execute SQL statement."""
+        plan = self.parse(sql)
+        if isinstance(plan, QueryResult):
+            return plan
+        
+        query_type, kwargs = plan
+        return self.executor.execute(query_type, **kwargs)
+    
+    def parse_execute_many(self, script: str) -> List[QueryResult]:
+        """Parse and execute each ';'-separated statement of a script in order."""
+        results = []
+        for sql in STATEMENT_PATTERN.findall(script):
+            if sql.isspace():
+                continue
+            plan = self.parse(sql)
+            if isinstance(plan, QueryResult):
+                results.append(plan)
+            else:
+                query_type, kwargs = plan
+                results.append(self.executor.execute(query_type, **kwargs))
+        return results
+    
+    def execute_prepared(self, sql: str, params: Tuple[Any, ...]) -> QueryResult:
+        """Execute a statement with '?' markers bound to params.
+        
+        The statement is parsed on first use only; params are bound as
+        Python values, so strings need no quoting or escaping.
+        """
+        prepared = self._prepared_cache.get(sql, self._prepare)
+        if isinstance(prepared, QueryResult):
+            return prepared
+        
+        param_count, (query_type, bind) = prepared
+        if len(params) != param_count:
+            return QueryResult(
+                success=False,
+                message=f"Expected {param_count} parameters, got {len(params)}"
+            )
+        
+        return self.executor.execute(query_type, **bind(params))
+    
+    def _prepare(self, sql: str) -> Union[Tuple[int, CompiledPlan], QueryResult]:
+        """Number the '?' markers of a statement and parse it."""
+        param_count = 0
+        
+        def number_param(match):
+            nonlocal param_count
+            if match.group(0) != '?':
+                return match.group(0)
+            param_count += 1
+            return f"?{param_count - 1}"
+        
+        sql = PARAM_PATTERN.sub(number_param, self._normalize(sql))
+        plan = self._compile_statement(sql)
+        if isinstance(plan, QueryResult):
+            return plan
+        return param_count, plan
+    
+    def parse(self, sql: str) -> Union[Plan, QueryResult]:
+        """Parse a SQL statement into a (QueryType, kwargs) plan.
+        
+        Returns a failed QueryResult if the statement is invalid.
+        """
+        # Repeated statement text skips normalization and literal stripping
+        templated = self._statement_cache.get(sql, self._parse_template)
+        if templated is None:
+            return self._parse_statement(self._normalize(sql))
+        
+        plan, params = templated
+        if isinstance(plan, QueryResult):
+            return plan
+        
+        # Bind the literals into a fresh copy of the cached plan
+        query_type, bind = plan
+        return query_type, bind(params)
+    
+    def _normalize(self, sql: str) -> str:
+        """Strip whitespace and trailing semicolons from a statement."""
         sql = sql.strip()
+        if sql.endswith(';'):
+            sql = sql.rstrip(';').rstrip()
+        return sql
+    
+    def _parse_template(self, sql: str) -> Optional[Tuple[Union[CompiledPlan, QueryResult], List[Any]]]:
+        """Parse a statement's template and literals, or None if it has none."""
+        sql = self._normalize(sql)
+        if '?' in sql or not sql[:_TEMPLATE_PREFIX_LENGTH].upper().startswith(TEMPLATE_PREFIXES):
+            return None
         
-        if not sql.endswith(';'):
-            sql = sql + ';'
-        
-        # Remove trailing semicolon for parsing
-        sql = sql.rstrip(';').strip()
-        
-        # Convert to uppercase for keyword matching
-        sql_upper = sql.upper()
-        
-        if sql_upper.startswith('CREATE TABLE'):
-            return self._parse_create_table(sql)
-        elif sql_upper.startswith('INSERT INTO'):
-            return self._parse_insert(sql)
-        elif sql_upper.startswith('SELECT'):
-            return self._parse_select(sql)
-        elif sql_upper.startswith('UPDATE'):
-            return self._parse_update(sql)
-        elif sql_upper.startswith('DELETE FROM'):
-            return self._parse_delete(sql)
-        elif sql_upper.startswith('DROP TABLE'):
-            return self._parse_drop_table(sql)
-        elif sql_upper.startswith('CREATE INDEX'):
-            return self._parse_create_index(sql)
-        elif sql_upper.startswith('DROP INDEX'):
-            return self._parse_drop_index(sql)
-        else:
+        # Replace literals with numbered placeholders and parse (or reuse)
+        # the template
+        literals = []
+        
+        def strip_literal(match):
+            literals.append(match.group(0))
+            return f"?{len(literals) - 1}"
+        
+        template = LITERAL_PATTERN.sub(strip_literal, sql)
+        plan = self.parse_cache.get(template, self._compile_statement)
+        params = [self._parse_value(literal) for literal in literals]
+        return plan, params
+    
+    def _compile_statement(self, sql: str) -> Union[CompiledPlan, QueryResult]:
+        """Parse a statement containing placeholders and compile its binder."""
+        plan = self._parse_statement(sql)
+        if isinstance(plan, QueryResult):
+            return plan
+        
+        query_type, kwargs = plan
+        return query_type, _compile_binder(kwargs)
+    
+    def _parse_statement(self, sql: str) -> Union[Plan, QueryResult]:
+        """Dispatch a normalized statement to its parser."""
+        # Only the leading keywords are upper-cased, not the whole statement
+        words = sql[:32].split(None, 2)
+        keyword = words[0].upper() if words else ''
+        if keyword in ('CREATE', 'DROP') and len(words) > 1:
+            keyword = f"{keyword} {words[1].upper()}"
+        
+        parser = self._parsers.get(keyword)
+        if parser is None:
             return QueryResult(
                 success=False,
                 message=f"Unsupported SQL statement: {sql}"
             )
+        return parser(sql)
     
-    def _parse_create_table(self, sql: str) -> QueryResult:
+    def _parse_create_table(self, sql: str) -> Union[Plan, QueryResult]:
         """Parse CREATE TABLE statement."""
-        # Simple regex for CREATE TABLE
-        pattern = r'CREATE TABLE (\w+)\s*\((.*)\)'
-        match = re.match(pattern, sql, re.IGNORECASE | re.DOTALL)
+        match = CREATE_TABLE_PATTERN.match(sql)
         
         if not match:
-            return QueryResult(
-                success=False,
-                message="Invalid CREATE TABLE syntax"
-            )
+            return _INVALID_CREATE_TABLE
         
         table_name = match.group(1)
         columns_sql = match.group(2).strip()
@@ -68,13 +349,9 @@ class SimpleSQLParser:
         columns = self._parse_column_definitions(columns_sql)
         
         if not columns:
-            return QueryResult(
-                success=False,
-                message="No valid columns found in CREATE TABLE"
-            )
+            return _NO_COLUMNS
         
-        return self.executor.execute(
-            QueryType.CREATE_TABLE,
+        return QueryType.CREATE_TABLE, dict(
             table_name=table_name,
             columns=columns
         )
@@ -84,27 +361,7 @@ class SimpleSQLParser:
         columns = []
         
         # Split by commas, but handle parentheses for complex types
-        parts = []
-        current = ""
-        paren_depth = 0
-        
-        for char in columns_sql:
-            if char == '(':
-                paren_depth += 1
-                current += char
-            elif char == ')':
-                paren_depth -= 1
-                current += char
-            elif char == ',' and paren_depth == 0:
-                parts.append(current.strip())
-                current = ""
-            else:
-                current += char
-        
-        if current.strip():
-            parts.append(current.strip())
-        
-        for part in parts:
+        for part in COLUMN_DEF_PATTERN.findall(columns_sql):
             column = self._parse_column_definition(part)
             if column:
                 columns.append(column)
@@ -137,37 +394,27 @@ class SimpleSQLParser:
             data_type_str = type_name
         
         # Map to DataType enum
-        type_map = {
-            'INTEGER': DataType.INTEGER,
-            'INT': DataType.INTEGER,
-            'BIGINT': DataType.BIGINT,
-            'VARCHAR': DataType.VARCHAR,
-            'TEXT': DataType.TEXT,
-            'STRING': DataType.TEXT,
-            'FLOAT': DataType.FLOAT,
-            'DOUBLE': DataType.DOUBLE,
-            'BOOLEAN': DataType.BOOLEAN,
-            'BOOL': DataType.BOOLEAN,
-            'DATE': DataType.DATE,
-            'TIMESTAMP': DataType.TIMESTAMP,
-        }
-        
-        if data_type_str not in type_map:
+        data_type = TYPE_NAMES.get(data_type_str)
+        if data_type is None:
             return None
         
-        data_type = type_map[data_type_str]
-        
         # Parse constraints
         constraints = []
-        for token in tokens[2:]:
-            token_upper = token.upper()
-            if token_upper == 'PRIMARY':
-                if 'KEY' in tokens[tokens.index(token) + 1:]:
-                    constraints.append(ColumnConstraint.PRIMARY_KEY)
-            elif token_upper == 'UNIQUE':
-                constraints.append(ColumnConstraint.UNIQUE)
-            elif token_upper == 'NOT' and 'NULL' in tokens[tokens.index(token) + 1:]:
+        words = [token.upper() for token in tokens]
+        i, n = 2, len(words)
+        while i < n:
+            word = words[i]
+            following = words[i + 1] if i + 1 < n else None
+            if word == 'PRIMARY' and following == 'KEY':
+                constraints.append(ColumnConstraint.PRIMARY_KEY)
+                i += 2
+            elif word == 'NOT' and following == 'NULL':
                 constraints.append(ColumnConstraint.NOT_NULL)
+                i += 2
+            else:
+                if word == 'UNIQUE':
+                    constraints.append(ColumnConstraint.UNIQUE)
+                i += 1
         
         return ColumnSchema(
             name=column_name,
@@ -176,17 +423,12 @@ class SimpleSQLParser:
             length=length
         )
     
-    def _parse_insert(self, sql: str) -> QueryResult:
+    def _parse_insert(self, sql: str) -> Union[Plan, QueryResult]:
         """Parse INSERT statement."""
-        # Simple regex for INSERT
-        pattern = r'INSERT INTO (\w+)\s*(?:\(([^)]+)\))?\s*VALUES\s*\(([^)]+)\)'
-        match = re.match(pattern, sql, re.IGNORECASE | re.DOTALL)
+        match = INSERT_PATTERN.match(sql)
         
         if not match:
-            return QueryResult(
-                success=False,
-                message="Invalid INSERT syntax"
-            )
+            return _INVALID_INSERT
         
         table_name = match.group(1)
         columns_str = match.group(2)
@@ -195,23 +437,17 @@ class SimpleSQLParser:
         # Parse values
         values = self._parse_value_list(values_str)
         
-        return self.executor.execute(
-            QueryType.INSERT,
+        return QueryType.INSERT, dict(
             table_name=table_name,
             values=values
         )
     
-    def _parse_select(self, sql: str) -> QueryResult:
+    def _parse_select(self, sql: str) -> Union[Plan, QueryResult]:
         """Parse SELECT statement."""
-        # Simple regex for SELECT
-        pattern = r'SELECT\s+(.+?)\s+FROM\s+(\w+)(?:\s+WHERE\s+(.+?))?(?:\s+LIMIT\s+(\d+))?'
-        match = re.match(pattern, sql, re.IGNORECASE | re.DOTALL)
+        match = SELECT_PATTERN.match(sql)
         
         if not match:
-            return QueryResult(
-                success=False,
-                message="Invalid SELECT syntax"
-            )
+            return _INVALID_SELECT
         
         columns_str = match.group(1).strip()
         table_name = match.group(2).strip()
@@ -228,34 +464,27 @@ class SimpleSQLParser:
         where_clause = None
         if where_str:
             where_clause = self._parse_where_clause(where_str.strip())
+            if isinstance(where_clause, QueryResult):
+                return where_clause
         
         # Parse LIMIT
         limit = None
         if limit_str:
-            try:
-                limit = int(limit_str.strip())
-            except ValueError:
-                pass
+            limit = self._parse_value(limit_str)
         
-        return self.executor.execute(
-            QueryType.SELECT,
+        return QueryType.SELECT, dict(
             table_name=table_name,
             columns=columns,
             where_clause=where_clause,
             limit=limit
         )
     
-    def _parse_update(self, sql: str) -> QueryResult:
+    def _parse_update(self, sql: str) -> Union[Plan, QueryResult]:
         """Parse UPDATE statement."""
-        # Simple regex for UPDATE
-        pattern = r'UPDATE\s+(\w+)\s+SET\s+(.+?)(?:\s+WHERE\s+(.+))?'
-        match = re.match(pattern, sql, re.IGNORECASE | re.DOTALL)
+        match = UPDATE_PATTERN.match(sql)
         
         if not match:
-            return QueryResult(
-                success=False,
-                message="Invalid UPDATE syntax"
-            )
+            return _INVALID_UPDATE
         
         table_name = match.group(1).strip()
         set_str = match.group(2).strip()
@@ -268,25 +497,21 @@ class SimpleSQLParser:
         where_clause = None
         if where_str:
             where_clause = self._parse_where_clause(where_str.strip())
+            if isinstance(where_clause, QueryResult):
+                return where_clause
         
-        return self.executor.execute(
-            QueryType.UPDATE,
+        return QueryType.UPDATE, dict(
             table_name=table_name,
             set_values=set_values,
             where_clause=where_clause
         )
     
-    def _parse_delete(self, sql: str) -> QueryResult:
+    def _parse_delete(self, sql: str) -> Union[Plan, QueryResult]:
         """Parse DELETE statement."""
-        # Simple regex for DELETE
-        pattern = r'DELETE FROM\s+(\w+)(?:\s+WHERE\s+(.+))?'
-        match = re.match(pattern, sql, re.IGNORECASE | re.DOTALL)
+        match = DELETE_PATTERN.match(sql)
         
         if not match:
-            return QueryResult(
-                success=False,
-                message="Invalid DELETE syntax"
-            )
+            return _INVALID_DELETE
         
         table_name = match.group(1).strip()
         where_str = match.group(2)
@@ -295,41 +520,33 @@ class SimpleSQLParser:
         where_clause = None
         if where_str:
             where_clause = self._parse_where_clause(where_str.strip())
+            if isinstance(where_clause, QueryResult):
+                return where_clause
         
-        return self.executor.execute(
-            QueryType.DELETE,
+        return QueryType.DELETE, dict(
             table_name=table_name,
             where_clause=where_clause
         )
     
-    def _parse_drop_table(self, sql: str) -> QueryResult:
+    def _parse_drop_table(self, sql: str) -> Union[Plan, QueryResult]:
         """Parse DROP TABLE statement."""
-        pattern = r'DROP TABLE\s+(\w+)'
-        match = re.match(pattern, sql, re.IGNORECASE)
+        match = DROP_TABLE_PATTERN.match(sql)
         
         if not match:
-            return QueryResult(
-                success=False,
-                message="Invalid DROP TABLE syntax"
-            )
+            return _INVALID_DROP_TABLE
         
         table_name = match.group(1).strip()
         
-        return self.executor.execute(
-            QueryType.DROP_TABLE,
+        return QueryType.DROP_TABLE, dict(
             table_name=table_name
         )
     
-    def _parse_create_index(self, sql: str) -> QueryResult:
+    def _parse_create_index(self, sql: str) -> Union[Plan, QueryResult]:
         """Parse CREATE INDEX statement."""
-        pattern = r'CREATE INDEX\s+(\w+)\s+ON\s+(\w+)\s*\(([^)]+)\)'
-        match = re.match(pattern, sql, re.IGNORECASE | re.DOTALL)
+        match = CREATE_INDEX_PATTERN.match(sql)
         
         if not match:
-            return QueryResult(
-                success=False,
-                message="Invalid CREATE INDEX syntax"
-            )
+            return _INVALID_CREATE_INDEX
         
         index_name = match.group(1).strip()
         table_name = match.group(2).strip()
@@ -337,81 +554,60 @@ class SimpleSQLParser:
         
         columns = [col.strip() for col in columns_str.split(',')]
         
-        return self.executor.execute(
-            QueryType.CREATE_INDEX,
+        return QueryType.CREATE_INDEX, dict(
             index_name=index_name,
             table_name=table_name,
             column_names=columns
         )
     
-    def _parse_drop_index(self, sql: str) -> QueryResult:
+    def _parse_drop_index(self, sql: str) -> Union[Plan, QueryResult]:
         """Parse DROP INDEX statement."""
-        pattern = r'DROP INDEX\s+(\w+)'
-        match = re.match(pattern, sql, re.IGNORECASE)
+        match = DROP_INDEX_PATTERN.match(sql)
         
         if not match:
-            return QueryResult(
-                success=False,
-                message="Invalid DROP INDEX syntax"
-            )
+            return _INVALID_DROP_INDEX
         
         index_name = match.group(1).strip()
         
-        return self.executor.execute(
-            QueryType.DROP_INDEX,
+        return QueryType.DROP_INDEX, dict(
             index_name=index_name
         )
     
     def _parse_value_list(self, values_str: str) -> List[Any]:
         """Parse a list of values from SQL."""
-        values = []
-        current = ""
-        in_quotes = False
-        quote_char = None
-        
-        for char in values_str:
-            if char in "'\"" and (quote_char is None or char == quote_char):
-                if in_quotes:
-                    in_quotes = False
-                    quote_char = None
-                else:
-                    in_quotes = True
-                    quote_char = char
-                current += char
-            elif char == ',' and not in_quotes:
-                values.append(self._parse_value(current.strip()))
-                current = ""
-            else:
-                current += char
-        
-        if current.strip():
-            values.append(self._parse_value(current.strip()))
-        
-        return values
+        return [self._parse_value(item) for item in LIST_ITEM_PATTERN.findall(values_str)]
     
     def _parse_value(self, value_str: str) -> Any:
         """Parse a single SQL value."""
         value_str = value_str.strip()
+        first = value_str[:1]
+        
+        # Placeholder left behind by literal stripping
+        if first == '?':
+            if value_str[1:].isdigit():
+                return _Placeholder(int(value_str[1:]))
         
         # Remove quotes
-        if (value_str.startswith("'") and value_str.endswith("'")) or \
-           (value_str.startswith('"') and value_str.endswith('"')):
-            return value_str[1:-1]
+        elif first == "'" or first == '"':
+            if value_str.endswith(first):
+                return value_str[1:-1]
         
         # Parse numbers
-        if value_str.replace('.', '', 1).replace('-', '', 1).isdigit():
-            if '.' in value_str:
-                return float(value_str)
-            else:
+        elif first.isdigit() or first == '-' or first == '.':
+            try:
                 return int(value_str)
+            except ValueError:
+                pass
+            try:
+                return float(value_str)
+            except ValueError:
+                pass
         
-        # Parse booleans
-        if value_str.upper() in ['TRUE', 'FALSE']:
-            return value_str.upper() == 'TRUE'
-        
-        # Parse NULL
-        if value_str.upper() == 'NULL':
-            return None
+        # Parse booleans and NULL
+        elif first.isalpha():
+            upper = value_str.upper()
+            if upper in KEYWORD_VALUES:
+                return KEYWORD_VALUES[upper]
         
         return value_str
     
@@ -419,31 +615,8 @@ class SimpleSQLParser:
         """Parse SET clause of UPDATE statement."""
         set_values = {}
         
-        # Split by commas, but handle quoted strings
-        parts = []
-        current = ""
-        in_quotes = False
-        quote_char = None
-        
-        for char in set_str:
-            if char in "'\"" and (quote_char is None or char == quote_char):
-                in_quotes = not in_quotes
-                if not in_quotes:
-                    quote_char = None
-                else:
-                    quote_char = char
-                current += char
-            elif char == ',' and not in_quotes:
-                parts.append(current.strip())
-                current = ""
-            else:
-                current += char
-        
-        if current.strip():
-            parts.append(current.strip())
-        
-        # Parse each assignment
-        for part in parts:
+        # Split by commas, but handle quoted strings, then parse each assignment
+        for part in LIST_ITEM_PATTERN.findall(set_str):
             if '=' in part:
                 col, val = part.split('=', 1)
                 col = col.strip()
@@ -452,24 +625,35 @@ class SimpleSQLParser:
         
         return set_values
     
-    def _parse_where_clause(self, where_str: str) -> Dict[str, Any]:
-        """Parse WHERE clause."""
-        where_clause = {}
+    def _parse_where_clause(self, where_str: str) -> Union[Dict[str, Any], QueryResult]:
+        """Parse WHERE clause: comparisons on distinct columns, joined by AND."""
+        # Split at AND outside quoted strings
+        conditions = []
+        start = 0
+        for match in WHERE_SEPARATOR_PATTERN.finditer(where_str):
+            separator = match.group(1)
+            if separator is None:
+                continue
+            if separator.upper() == 'OR':
+                return _UNSUPPORTED_WHERE
+            conditions.append(where_str[start:match.start()])
+            start = match.end()
+        conditions.append(where_str[start:])
         
-        # Simple equality for now: column = value
-        if '=' in where_str:
-            left, right = where_str.split('=', 1)
-            left = left.strip()
-            right = self._parse_value(right.strip())
-            where_clause[left] = right
-        
-        # Handle operators
-        for op in ['!=', '>=', '<=', '>', '<']:
-            if op in where_str:
-                left, right = where_str.split(op, 1)
-                left = left.strip()
-                right = self._parse_value(right.strip())
-                where_clause[left] = (op, right)
-                break
-        
-        return where_clause
\ No newline at end of file
+        where_clause = {}
+        for condition in conditions:
+            match = WHERE_PATTERN.fullmatch(condition)
+            if not match:
+                return _UNSUPPORTED_WHERE
+            
+            left, op, right = match.groups()
+            left = sys.intern(left)
+            if left in where_clause:
+                # One condition per column
+                return _UNSUPPORTED_WHERE
+            right = self._parse_value(right)
+            
+            # Simple equality is stored as the bare value
+            where_clause[left] = right if op == '=' else (op, right)
+        
+        return where_clause
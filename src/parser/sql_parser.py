@@ -10,31 +10,42 @@ from ..catalog.schema import ColumnConstraint, DataType
 from .lexer import SQLLexer, TokenType, Token
 from .ast_nodes import *
 
+# Tokens that may start a column constraint
+_CONSTRAINT_TOKENS = frozenset({TokenType.PRIMARY, TokenType.UNIQUE, TokenType.NOT, TokenType.NULL})
+
+# Tokens accepted as a WHERE comparison operator
+_COMPARISON_TOKENS = frozenset({
+    TokenType.EQUALS, TokenType.NOT_EQUALS,
+    TokenType.LESS_THAN, TokenType.GREATER_THAN,
+    TokenType.LESS_EQUALS, TokenType.GREATER_EQUALS,
+})
+
 class SQLParser:
     """Parses SQL tokens into abstract syntax tree (AST)."""
 
     def __init__(self, tokens: List[Token]):
+        # End with an EOF sentinel so advance() never runs off the list
+        if not tokens or tokens[-1].type != TokenType.EOF:
+            tokens = tokens + [Token(TokenType.EOF, "")]
         self.tokens = tokens
         self.position = 0
-        self.current_token = self.tokens[0] if tokens else None
+        self.current_token = self.tokens[0]
+        # Statement parsers by leading keyword (DELETE and UPDATE have none yet)
+        self._dispatch = {
+            TokenType.CREATE: self.parse_create,
+            TokenType.INSERT: self.parse_insert,
+            TokenType.SELECT: self.parse_select,
+        }
 
     def parse(self) -> ASTNode:
         """Parse tokens into an AST node."""
-        if not self.tokens:
+        if self.current_token.type == TokenType.EOF:
             raise SyntaxError("No tokens to parse")
 
-        if self.current_token.type == TokenType.CREATE:
-            return self.parse_create()
-        elif self.current_token.type == TokenType.INSERT:
-            return self.parse_insert()
-        elif self.current_token.type == TokenType.SELECT:
-            return self.parse_select()
-        elif self.current_token.type == TokenType.DELETE:
-            return self.parse_delete()
-        elif self.current_token.type == TokenType.UPDATE:
-            return self.parse_update()
-        else:
+        parse_statement = self._dispatch.get(self.current_token.type)
+        if parse_statement is None:
             raise SyntaxError(f"Unsupported statement type: {self.current_token.type}")
+        return parse_statement()
 
     # ---------------- CREATE TABLE ----------------
     def parse_create(self) -> CreateTableStatement:
@@ -81,7 +92,7 @@ class SQLParser:
 
         # Column constraints
         constraints = []
-        while self.current_token.type in [TokenType.PRIMARY, TokenType.UNIQUE, TokenType.NOT, TokenType.NULL]:
+        while self.current_token.type in _CONSTRAINT_TOKENS:
             if self.current_token.type == TokenType.PRIMARY:
                 self.advance()
                 self.expect(TokenType.KEY, "Expected KEY after PRIMARY")
@@ -183,11 +194,7 @@ class SQLParser:
         left = self.expect(TokenType.IDENTIFIER, "Expected column name").value
 
         op_token = self.current_token
-        if op_token.type not in [
-            TokenType.EQUALS, TokenType.NOT_EQUALS,
-            TokenType.LESS_THAN, TokenType.GREATER_THAN,
-            TokenType.LESS_EQUALS, TokenType.GREATER_EQUALS
-        ]:
+        if op_token.type not in _COMPARISON_TOKENS:
             raise SyntaxError(f"Expected comparison operator, got {op_token.type}")
         self.advance()
 
@@ -201,16 +208,14 @@ class SQLParser:
             raise SyntaxError(f"Unexpected value in WHERE clause: {self.current_token.type}")
         self.advance()
 
-        return {"column": left, "operator": op_token.type.value, "value": right}
+        # An operator token's text is its operator string; no enum lookup needed
+        return {"column": left, "operator": op_token.value, "value": right}
 
     # ---------------- Helpers ----------------
     def advance(self):
         """Move to the next token."""
         self.position += 1
-        if self.position < len(self.tokens):
-            self.current_token = self.tokens[self.position]
-        else:
-            self.current_token = Token(TokenType.EOF, "")
+        self.current_token = self.tokens[self.position]
 
     def expect(self, token_type: TokenType, message: str) -> Token:
         """Expect a specific token type and advance, or raise error."""
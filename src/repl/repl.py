@@ -80,22 +80,24 @@ class PyMiniDBREPL:
                 if not text:
                     continue
                 
-                # Handle special commands
-                if text.lower() in ['exit', 'quit', '\\q']:
+                # Handle special commands. Only the head of the line is
+                # lower-cased; no command is longer than it.
+                command = text[:16].lower()
+                if command in ['exit', 'quit', '\\q']:
                     print("Goodbye!")
                     self.storage.close()
                     break
-                elif text.lower() in ['help', '\\?']:
+                elif command in ['help', '\\?']:
                     self._show_help()
                     continue
-                elif text.lower() in ['tables', '\\dt']:
+                elif command in ['tables', '\\dt']:
                     self._show_tables()
                     continue
-                elif text.lower().startswith('describe '):
+                elif command.startswith('describe '):
                     table_name = text[9:].strip()
                     self._describe_table(table_name)
                     continue
-                elif text.lower() == 'clear':
+                elif command == 'clear':
                     os.system('cls' if os.name == 'nt' else 'clear')
                     continue
                 
@@ -302,21 +304,22 @@ class SimpleREPL:
                 if not text:
                     continue
                 
-                if text.lower() in ['exit', 'quit', '\\q']:
+                command = text[:16].lower()
+                if command in ['exit', 'quit', '\\q']:
                     print("Goodbye!")
                     self.storage.close()
                     break
-                elif text.lower() in ['help', '\\?']:
+                elif command in ['help', '\\?']:
                     self._show_help()
                     continue
-                elif text.lower() in ['tables', '\\dt']:
+                elif command in ['tables', '\\dt']:
                     self._show_tables()
                     continue
-                elif text.lower().startswith('describe '):
+                elif command.startswith('describe '):
                     table_name = text[9:].strip()
                     self._describe_table(table_name)
                     continue
-                elif text.lower() == 'clear':
+                elif command == 'clear':
                     os.system('cls' if os.name == 'nt' else 'clear')
                     continue
                 
@@ -0,0 +1,289 @@
+"""
+Column-major (SoA) in-memory storage for table rows.
+"""
+from array import array
+from itertools import compress, count
+from typing import List, Dict, Any, Iterator, MutableSequence, Optional, Sequence, Tuple
+
+class Dictionary:
+    """Dictionary encoding for one low-cardinality column.
+
+    The column list holds small int codes; values[code] is the value.
+    """
+
+    # Columns with more distinct values than this are stored flat again
+    MAX_SIZE = 4096
+
+    __slots__ = ('values', 'codes')
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        """Get the code for a value, adding it to the dictionary if new."""
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code(self, value: Any) -> int:
+        """Get the code for a value, or -1 if it never occurs."""
+        return self.codes.get(value, -1)
+
+    def decode(self, codes: Sequence[int]) -> List[Any]:
+        """Map a sequence of codes back to their values."""
+        return list(map(self.values.__getitem__, codes))
+
+class ColumnStore:
+    """Stores a table's rows as one Python list per column.
+
+    Position i across all column lists (and row_ids) is one row. Scans that
+    only need a few columns touch only those lists. Columns with a
+    Dictionary in `encodings` hold codes instead of values. Columns given a
+    typecode are packed array.arrays until a value does not fit (a NULL or
+    an out-of-range int), at which point they become lists.
+
+    row_index maps row ID to position. Compaction shifts positions, so it
+    drops the map and the next lookup rebuilds it.
+
+    delete_many only marks rows dead in the `live` flags (one byte per
+    position, None while every row is live); the columns are compacted once
+    more than COMPACT_RATIO of the rows are dead. Scans skip dead rows.
+    """
+
+    # Fraction of dead rows at which delete_many compacts the columns
+    COMPACT_RATIO = 0.25
+
+    __slots__ = ('columns', 'row_ids', 'encodings', 'row_index', 'live', 'dead')
+
+    def __init__(self, column_count: int, encoded: Sequence[bool] = (),
+                 typecodes: Sequence[Optional[str]] = ()):
+        self.columns: List[MutableSequence[Any]] = [[] for _ in range(column_count)]
+        for i, typecode in enumerate(typecodes):
+            if typecode is not None:
+                self.columns[i] = array(typecode)
+        self.row_ids: List[int] = []
+        self.row_index: Optional[Dict[int, int]] = {}
+        self.live: Optional[bytearray] = None
+        self.dead = 0
+        self.encodings: List[Optional[Dictionary]] = [None] * column_count
+        for i, is_encoded in enumerate(encoded):
+            if is_encoded:
+                self.encodings[i] = Dictionary()
+
+    def __len__(self) -> int:
+        return len(self.row_ids) - self.dead
+
+    def append(self, row_id: int, values: Sequence[Any]) -> None:
+        """Append a row at the end of every column."""
+        for i, value in enumerate(values):
+            value = self._encode(i, value)
+            try:
+                self.columns[i].append(value)
+            except (TypeError, OverflowError):
+                self._unpack(i)
+                self.columns[i].append(value)
+        if self.row_index is not None:
+            self.row_index[row_id] = len(self.row_ids)
+        if self.live is not None:
+            self.live.append(1)
+        self.row_ids.append(row_id)
+
+    def extend(self, row_ids: Sequence[int], rows: Sequence[Sequence[Any]]) -> None:
+        """Append many rows, filling one column at a time."""
+        start = len(self.row_ids)
+        for i, values in enumerate(zip(*rows)):
+            encoding = self.encodings[i]
+            if encoding is not None:
+                codes = list(map(encoding.encode, values))
+                if len(encoding.values) > Dictionary.MAX_SIZE:
+                    self._demote(i)
+                else:
+                    values = codes
+            column = self.columns[i]
+            if isinstance(column, array):
+                try:
+                    # Convert first so a bad value leaves the column unchanged
+                    values = array(column.typecode, values)
+                except (TypeError, OverflowError):
+                    self._unpack(i)
+            self.columns[i].extend(values)
+        if self.row_index is not None:
+            self.row_index.update(zip(row_ids, range(start, start + len(row_ids))))
+        if self.live is not None:
+            self.live.extend(b"\x01" * len(row_ids))
+        self.row_ids.extend(row_ids)
+
+    def position(self, row_id: int) -> int:
+        """Get the position of a row, or -1 if it is not stored."""
+        if self.row_index is None:
+            self.row_index = {
+                self.row_ids[i]: i for i in self.batch().positions()
+            }
+        return self.row_index.get(row_id, -1)
+
+    def get_row(self, position: int) -> List[Any]:
+        """Get the values of the row at a position."""
+        return [
+            column[position] if encoding is None else encoding.values[column[position]]
+            for column, encoding in zip(self.columns, self.encodings)
+        ]
+
+    def set_row(self, position: int, values: Sequence[Any]) -> None:
+        """Overwrite the values of the row at a position."""
+        for i, value in enumerate(values):
+            value = self._encode(i, value)
+            try:
+                self.columns[i][position] = value
+            except (TypeError, OverflowError):
+                self._unpack(i)
+                self.columns[i][position] = value
+
+    def delete(self, position: int) -> None:
+        """Remove the row at a position."""
+        for column in self.columns:
+            del column[position]
+        del self.row_ids[position]
+        if self.live is not None:
+            if not self.live[position]:
+                self.dead -= 1
+            del self.live[position]
+        self.row_index = None
+
+    def delete_many(self, positions: Sequence[int]) -> None:
+        """Mark the rows at the given live positions as deleted."""
+        if not positions:
+            return
+        if self.live is None:
+            self.live = bytearray(b"\x01" * len(self.row_ids))
+        live = self.live
+        for position in positions:
+            live[position] = 0
+        self.dead += len(positions)
+        if self.row_index is not None:
+            for position in positions:
+                del self.row_index[self.row_ids[position]]
+        if self.dead > len(self.row_ids) * self.COMPACT_RATIO:
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop dead rows from the columns."""
+        if self.live is None:
+            return
+        live = self.live
+        self.columns = [
+            array(column.typecode, compress(column, live)) if isinstance(column, array)
+            else list(compress(column, live))
+            for column in self.columns
+        ]
+        self.row_ids = list(compress(self.row_ids, live))
+        self.live = None
+        self.dead = 0
+        self.row_index = None
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Iterate over rows as value tuples, in storage order."""
+        return self.batch().rows()
+
+    def batch(self) -> 'ColumnBatch':
+        """Get a view over the current columns for a scan."""
+        return ColumnBatch(self.columns, self.row_ids, self.encodings, self.live)
+
+    def update(self, positions: Sequence[int], column_index: int, value: Any) -> None:
+        """Set one column to value for the rows at the given positions."""
+        value = self._encode(column_index, value)
+        column = self.columns[column_index]
+        if isinstance(column, array):
+            try:
+                # Check the value fits before changing any row
+                array(column.typecode, (value,))
+            except (TypeError, OverflowError):
+                column = self._unpack(column_index)
+        for position in positions:
+            column[position] = value
+
+    def _encode(self, column_index: int, value: Any) -> Any:
+        """Encode a value for storage in a column."""
+        encoding = self.encodings[column_index]
+        if encoding is None:
+            return value
+
+        code = encoding.encode(value)
+        if len(encoding.values) > Dictionary.MAX_SIZE:
+            self._demote(column_index)
+            return value
+        return code
+
+    def _unpack(self, column_index: int) -> List[Any]:
+        """Convert a packed array column to a list that can hold any value."""
+        column = self.columns[column_index] = list(self.columns[column_index])
+        return column
+
+    def _demote(self, column_index: int) -> None:
+        """Decode a column whose dictionary grew too large to flat storage."""
+        self.columns[column_index] = self.encodings[column_index].decode(
+            self.columns[column_index]
+        )
+        self.encodings[column_index] = None
+
+class ColumnBatch:
+    """A view of a table's columns, as seen by one query.
+
+    The column lists are shared with the store, not copied; a batch is only
+    valid until the table is next modified. Positions index the column lists
+    and include dead rows when `live` is set; positions() lists the live ones.
+    """
+
+    __slots__ = ('columns', 'row_ids', 'encodings', 'live')
+
+    def __init__(self, columns: List[List[Any]], row_ids: List[int],
+                 encodings: Optional[List[Optional[Dictionary]]] = None,
+                 live: Optional[bytearray] = None):
+        self.columns = columns
+        self.row_ids = row_ids
+        self.encodings = encodings if encodings is not None else [None] * len(columns)
+        self.live = live
+
+    def __len__(self) -> int:
+        if self.live is None:
+            return len(self.row_ids)
+        return self.live.count(1)
+
+    def positions(self) -> Sequence[int]:
+        """Get the positions of the live rows, in storage order."""
+        if self.live is None:
+            return range(len(self.row_ids))
+        return list(compress(count(), self.live))
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Iterate over live rows as value tuples."""
+        return zip(*self.project(range(len(self.columns))))
+
+    def take(self, positions: Sequence[int]) -> 'ColumnBatch':
+        """Get a batch of only the rows at positions, in that order."""
+        return ColumnBatch(
+            [[column[p] for p in positions] for column in self.columns],
+            [self.row_ids[p] for p in positions],
+            self.encodings,
+        )
+
+    def project(self, column_indexes: Sequence[int],
+                positions: Optional[Sequence[int]] = None) -> List[List[Any]]:
+        """Get the given columns as values at positions (default: all live rows).
+
+        Encoded columns are decoded only at the requested positions.
+        """
+        if positions is None and self.live is not None:
+            positions = self.positions()
+        projected = []
+        for i in column_indexes:
+            column = self.columns[i]
+            if positions is not None:
+                column = [column[p] for p in positions]
+            elif isinstance(column, array):
+                column = list(column)
+            encoding = self.encodings[i]
+            projected.append(column if encoding is None else encoding.decode(column))
+        return projected
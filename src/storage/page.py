@@ -3,6 +3,7 @@ Page structure implementation.
 Each page is 4096 bytes (4KB) with a header and data section.
 """
 import struct
+import zlib
 from typing import Optional, List, Tuple
 from enum import IntEnum
 
@@ -28,12 +29,16 @@ class Page:
     PAGE_SIZE = 4096
     HEADER_SIZE = 8 + 1 + 4 + 2 + 2 + 8 + 4  # 29 bytes
     DATA_SIZE = PAGE_SIZE - HEADER_SIZE  # 4067 bytes
+    CHECKSUM_OFFSET = HEADER_SIZE - 4  # checksum is the last header field
     
     # Struct format for header packing/unpacking
     HEADER_FORMAT = "<Q B I H H Q I"  # < for little-endian, Q=uint64, B=uint8, I=uint32, H=uint16
+    # Compiled once, so packing does not re-parse the format
+    HEADER_STRUCT = struct.Struct(HEADER_FORMAT)
+    CHECKSUM_STRUCT = struct.Struct("<I")
     
     def __init__(self, page_id: int, page_type: PageType = PageType.FREE, 
-                 table_id: int = 0):
+                 table_id: int = 0, data: Optional[bytearray] = None):
         """Initialize a new page."""
         self.page_id = page_id
         self.page_type = page_type
@@ -42,47 +47,31 @@ class Page:
         self.free_space_end = self.PAGE_SIZE
         self.lsn = 0  # Log Sequence Number
         self.checksum = 0
-        self.data = bytearray(self.DATA_SIZE)
+        self.data = data if data is not None else bytearray(self.DATA_SIZE)
         self.dirty = False
         
     def serialize(self) -> bytes:
         """Convert page to bytes for disk storage."""
-        # Pack header with initial checksum (0)
-        header = struct.pack(
-            self.HEADER_FORMAT,
+        # Pack header with a zero checksum, so the stored checksum never
+        # feeds into the new one
+        buf = bytearray(self.PAGE_SIZE)
+        self.HEADER_STRUCT.pack_into(
+            buf, 0,
             self.page_id,
             self.page_type,
             self.table_id,
             self.free_space_start,
             self.free_space_end,
             self.lsn,
-            self.checksum  # This will be 0 initially
+            0
         )
+        buf[self.HEADER_SIZE:] = self.data
         
-        # Calculate checksum
-        self.checksum = self._calculate_checksum(header + self.data)
+        # Calculate checksum and write it over the zero field
+        self.checksum = self._calculate_checksum(buf)
+        self.CHECKSUM_STRUCT.pack_into(buf, self.CHECKSUM_OFFSET, self.checksum)
         
-        # Repack with correct checksum
-        header = struct.pack(
-            self.HEADER_FORMAT,
-            self.page_id,
-            self.page_type,
-            self.table_id,
-            self.free_space_start,
-            self.free_space_end,
-            self.lsn,
-            self.checksum
-        )
-        
-        # Combine header and data
-        result = header + self.data
-        
-        # DEBUG: Print sizes
-        # print(f"[DEBUG] Header size: {len(header)}")
-        # print(f"[DEBUG] Data size: {len(self.data)}")
-        # print(f"[DEBUG] Total: {len(result)}")
-        
-        return result
+        return bytes(buf)
     
     @classmethod
     def deserialize(cls, page_id: int, raw_data: bytes) -> 'Page':
@@ -91,36 +80,28 @@ class Page:
             raise ValueError(f"Expected {cls.PAGE_SIZE} bytes, got {len(raw_data)}")
         
         # Unpack header
-        header = raw_data[:cls.HEADER_SIZE]
         (page_id_val, page_type_val, table_id_val, 
-         free_space_start, free_space_end, lsn, checksum) = struct.unpack(cls.HEADER_FORMAT, header)
+         free_space_start, free_space_end, lsn, checksum) = cls.HEADER_STRUCT.unpack_from(raw_data)
+        
+        # A page never written since the file was extended is all zeros
+        # (no real page has free space starting inside the header)
+        if free_space_start == 0:
+            return cls(page_id)
         
-        # Create page first
-        page = cls(page_id_val, PageType(page_type_val), table_id_val)
+        # Create page with a copy of the data (starting from HEADER_SIZE).
+        # Slicing a memoryview does not copy, so this is the only copy.
+        data = bytearray(raw_data[cls.HEADER_SIZE:cls.PAGE_SIZE])
+        page = cls(page_id_val, PageType(page_type_val), table_id_val, data)
         page.free_space_start = free_space_start
         page.free_space_end = free_space_end
         page.lsn = lsn
         page.checksum = checksum
         
-        # Copy data (starting from HEADER_SIZE)
-        page.data = bytearray(raw_data[cls.HEADER_SIZE:cls.PAGE_SIZE])
-        
         return page
     
     def _calculate_checksum(self, data: bytes) -> int:
-        """Calculate simple checksum for data integrity."""
-        if len(data) < 4:
-            return 0
-            
-        checksum = 0
-        # Process in 4-byte chunks
-        for i in range(0, len(data), 4):
-            chunk = data[i:i+4]
-            if len(chunk) < 4:
-                # Pad with zeros if needed
-                chunk = chunk + b'\x00' * (4 - len(chunk))
-            checksum ^= struct.unpack('<I', chunk)[0]
-        return checksum & 0xFFFFFFFF
+        """Calculate a CRC-32 checksum for data integrity."""
+        return zlib.crc32(data)
     
     def allocate_space(self, size: int) -> Optional[int]:
         """Allocate space in the page for a record.
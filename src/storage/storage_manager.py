@@ -1,16 +1,32 @@
 """
 Storage manager handles all disk I/O operations.
 """
+import mmap
 import os
 import struct
-from typing import Dict, Optional, List
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Optional, List, Iterator
 from pathlib import Path
 from .page import Page, PageType
 
+# Positional I/O: one syscall per read or write, with no shared file offset
+if hasattr(os, 'pread'):
+    _pread, _pwrite = os.pread, os.pwrite
+else:  # Windows
+    def _pread(fd: int, size: int, offset: int) -> bytes:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size)
+    
+    def _pwrite(fd: int, data: bytes, offset: int) -> int:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.write(fd, data)
+
 class DatabaseHeader:
     """Database file header structure."""
     HEADER_SIZE = 4096  # First page is always header
     MAGIC_NUMBER = 0x504D4442  # "PMDB" in hex
+    FIELDS_STRUCT = struct.Struct("<I I Q Q Q Q I")  # 44 bytes
     
     def __init__(self):
         self.magic = self.MAGIC_NUMBER
@@ -23,8 +39,7 @@ class DatabaseHeader:
     
     def serialize(self) -> bytes:
         """Serialize header to bytes."""
-        return struct.pack(
-            "<I I Q Q Q Q I",
+        return self.FIELDS_STRUCT.pack(
             self.magic,
             self.page_size,
             self.db_size,
@@ -37,11 +52,12 @@ class DatabaseHeader:
     @classmethod
     def deserialize(cls, data: bytes) -> 'DatabaseHeader':
         """Deserialize header from bytes."""
-        if len(data) < 44:  # Changed from 36 to 44
-            raise ValueError(f"Invalid header data: expected at least 44 bytes, got {len(data)}")
+        size = cls.FIELDS_STRUCT.size
+        if len(data) < size:
+            raise ValueError(f"Invalid header data: expected at least {size} bytes, got {len(data)}")
         
         (magic, page_size, db_size, catalog_root, 
-         free_list_head, last_transaction_id, checksum) = struct.unpack("<I I Q Q Q Q I", data[:44])  # Changed slice
+         free_list_head, last_transaction_id, checksum) = cls.FIELDS_STRUCT.unpack_from(data)
         
         if magic != cls.MAGIC_NUMBER:
             raise ValueError(f"Invalid magic number: {hex(magic)} expected {hex(cls.MAGIC_NUMBER)}")
@@ -60,11 +76,27 @@ class DatabaseHeader:
 class StorageManager:
     """Manages all disk I/O operations for the database."""
     
-    def __init__(self, db_path: str):
+    DEFAULT_WRITE_BUF_SIZE = 64 * 1024
+    DEFAULT_CACHE_SIZE = 1024  # pages (4 MB)
+    
+    def __init__(self, db_path: str, write_buf_size: int = DEFAULT_WRITE_BUF_SIZE,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
         self.db_path = Path(db_path)
         self.file = None
+        self.fd = -1
+        # Shared mapping of the whole file that pages are read from
+        self._mmap: Optional[mmap.mmap] = None
         self.header = DatabaseHeader()
         self.is_open = False
+        # Size at which queued batch writes are drained, rounded down to
+        # whole pages
+        self.write_buf_size = max(write_buf_size // Page.PAGE_SIZE, 1) * Page.PAGE_SIZE
+        # Serialized pages queued by write_page while a batch is open
+        self._batch: Optional[Dict[int, bytes]] = None
+        # Recently read or written pages, least recently used first. Reads
+        # of a cached page return the same Page object.
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[int, Page]' = OrderedDict()
         
     def create_database(self, overwrite: bool = False) -> None:
         """Create a new database file."""
@@ -81,10 +113,9 @@ class StorageManager:
             self.header.db_size = initial_pages
             f.write(self.header.serialize())
             
-            # Initialize free pages (all except header)
-            for page_id in range(1, initial_pages):
-                page = Page(page_id, PageType.FREE)
-                f.write(page.serialize())
+            # Reserve free pages (all except header); zeroed pages read
+            # back as FREE
+            f.truncate(initial_pages * Page.PAGE_SIZE)
         
         print(f"Created database: {self.db_path}")
     
@@ -93,25 +124,39 @@ class StorageManager:
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database {self.db_path} not found")
         
-        self.file = open(self.db_path, 'r+b')
+        # Unbuffered: pages are read and written whole with pread/pwrite on
+        # the raw descriptor
+        self.file = open(self.db_path, 'r+b', buffering=0)
+        self.fd = self.file.fileno()
         
         # Read and validate header
-        self.file.seek(0)
-        header_data = self.file.read(DatabaseHeader.HEADER_SIZE)
+        header_data = _pread(self.fd, DatabaseHeader.HEADER_SIZE, 0)
         self.header = DatabaseHeader.deserialize(header_data)
         
         if self.header.page_size != Page.PAGE_SIZE:
             raise ValueError(f"Page size mismatch: expected {Page.PAGE_SIZE}, got {self.header.page_size}")
         
+        self._mmap = mmap.mmap(self.fd, 0)
+        self._cache.clear()
         self.is_open = True
         print(f"Opened database: {self.db_path} (pages: {self.header.db_size})")
     
     def close(self) -> None:
         """Close database file."""
+        if self.is_open:
+            self.flush_all()
+        if self._batch is not None and self.file:
+            self.end_batch()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
         if self.file:
+            os.fsync(self.fd)
             self.file.close()
             self.file = None
+            self.fd = -1
             self.is_open = False
+            self._cache.clear()
             print("Database closed")
     
     def read_page(self, page_id: int) -> Page:
@@ -122,14 +167,30 @@ class StorageManager:
         if page_id >= self.header.db_size:
             raise ValueError(f"Page {page_id} out of bounds")
         
-        offset = page_id * Page.PAGE_SIZE
-        self.file.seek(offset)
-        page_data = self.file.read(Page.PAGE_SIZE)
+        page = self._cache.get(page_id)
+        if page is not None:
+            self._cache.move_to_end(page_id)
+            return page
         
-        if len(page_data) != Page.PAGE_SIZE:
-            raise ValueError(f"Could not read full page {page_id}")
+        page_data = None
+        if self._batch is not None:
+            page_data = self._batch.get(page_id)
+        if page_data is not None:
+            page = Page.deserialize(page_id, page_data)
+        else:
+            offset = page_id * Page.PAGE_SIZE
+            if offset + Page.PAGE_SIZE > len(self._mmap):
+                raise ValueError(f"Could not read full page {page_id}")
+            
+            # Deserialize straight from the mapping, so the page data is
+            # copied once. The views are released before returning, as the
+            # mapping cannot be closed or replaced while any are held.
+            with memoryview(self._mmap) as view, \
+                    view[offset:offset + Page.PAGE_SIZE] as page_view:
+                page = Page.deserialize(page_id, page_view)
         
-        return Page.deserialize(page_id, page_data)
+        self._cache_page(page)
+        return page
     
     def write_page(self, page: Page) -> None:
         """Write a page to disk."""
@@ -139,12 +200,75 @@ class StorageManager:
         if page.page_id >= self.header.db_size:
             self._extend_file(page.page_id + 1)
         
-        offset = page.page_id * Page.PAGE_SIZE
-        self.file.seek(offset)
-        self.file.write(page.serialize())
-        self.file.flush()
+        self._cache_page(page)
+        self._store_page(page)
+    
+    def _store_page(self, page: Page) -> None:
+        """Queue or write a page's bytes, marking it clean."""
+        if self._batch is not None:
+            self._batch[page.page_id] = page.serialize()
+            page.dirty = False
+            # Drain the queue once it fills the write buffer
+            if len(self._batch) * Page.PAGE_SIZE >= self.write_buf_size:
+                self._write_batch()
+            return
+        
+        _pwrite(self.fd, page.serialize(), page.page_id * Page.PAGE_SIZE)
         page.dirty = False
     
+    def flush_all(self) -> None:
+        """Write every cached page modified since it was last read or written."""
+        for page in list(self._cache.values()):
+            if page.dirty:
+                self._store_page(page)
+    
+    def _cache_page(self, page: Page) -> None:
+        """Make page the most recently used cache entry, evicting the least."""
+        self._cache[page.page_id] = page
+        self._cache.move_to_end(page.page_id)
+        if len(self._cache) > self.cache_size:
+            _, evicted = self._cache.popitem(last=False)
+            if evicted.dirty:
+                self._store_page(evicted)
+    
+    @contextmanager
+    def begin_batch(self) -> Iterator['StorageManager']:
+        """Queue page writes and submit them together when the block exits.
+        
+        Usage: with storage.begin_batch(): ...
+        """
+        if not self.is_open:
+            raise RuntimeError("Database not open")
+        
+        if self._batch is not None:
+            # Nested batches join the outer one
+            yield self
+            return
+        
+        self._batch = {}
+        try:
+            yield self
+        finally:
+            self.end_batch()
+    
+    def end_batch(self) -> None:
+        """Write all queued pages and close the batch."""
+        if self._batch:
+            self._write_batch()
+        self._batch = None
+    
+    def _write_batch(self) -> None:
+        """Write queued pages, one write per run of adjacent pages."""
+        batch, self._batch = self._batch, {}
+        
+        page_ids = sorted(batch)
+        run_start = 0
+        for i in range(1, len(page_ids) + 1):
+            if i == len(page_ids) or page_ids[i] != page_ids[i - 1] + 1:
+                data = b''.join(batch[pid] for pid in page_ids[run_start:i])
+                _pwrite(self.fd, data, page_ids[run_start] * Page.PAGE_SIZE)
+                run_start = i
+    
     def allocate_page(self, page_type: PageType, table_id: int = 0) -> Page:
         """Allocate a new page from free list or extend file."""
         # TODO: Implement free list management
@@ -163,17 +287,16 @@ class StorageManager:
             return
         
         old_size = self.header.db_size
-        self.file.seek(old_size * Page.PAGE_SIZE)
         
-        # Write new free pages
-        for page_id in range(old_size, new_size):
-            page = Page(page_id, PageType.FREE)
-            self.file.write(page.serialize())
+        # Grow the file and map it again; the new pages are zeroed and read
+        # back as FREE
+        os.ftruncate(self.fd, new_size * Page.PAGE_SIZE)
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = mmap.mmap(self.fd, 0)
         
         # Update header
         self.header.db_size = new_size
-        self.file.seek(0)
-        self.file.write(self.header.serialize())
-        self.file.flush()
+        _pwrite(self.fd, self.header.serialize(), 0)
         
         print(f"Extended database from {old_size} to {new_size} pages")
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Test the disk-oriented B+ Tree index.
+"""
+import dataclasses
+import random
+from array import array
+
+import pytest
+
+from src.index.bplus_tree import BPlusTree, BPlusTreeConfig, NodeType
+
+def _depth(tree: BPlusTree) -> int:
+    """Count the levels from the root down to the leaves."""
+    node, depth = tree._get_node(tree.root_node_id), 1
+    while node.node_type != NodeType.LEAF:
+        node, depth = tree._get_node(node.children[0]), depth + 1
+    return depth
+
+def test_config_derives_node_limits():
+    """Test that node limits are computed once and the config is immutable."""
+    config = BPlusTreeConfig(order=5)
+    assert (config.max_keys, config.min_keys) == (4, 2)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.order = 7
+
+def test_int_keys_across_splits():
+    """Test 8-byte int keys, including negative and 64-bit boundary values."""
+    keys = list(range(-500, 500)) + [-2 ** 63, 2 ** 63 - 1, -2 ** 31, 2 ** 31]
+    random.Random(5).shuffle(keys)
+    
+    tree = BPlusTree(1, BPlusTreeConfig(order=4, key_size=8))
+    assert tree.int_keys
+    for i, key in enumerate(keys):
+        tree.insert(key, i)
+    
+    assert _depth(tree) >= 4
+    root = tree._get_node(tree.root_node_id)
+    assert isinstance(root.children, array) and root.children.typecode == 'q'
+    
+    for i, key in enumerate(keys):
+        assert tree.search(key) == i
+    assert tree.search(501) is None
+    
+    position = {key: i for i, key in enumerate(keys)}
+    in_order = sorted(keys)
+    assert list(tree.range_search(-2 ** 63, 2 ** 63 - 1)) == [position[k] for k in in_order[:-1]]
+    assert list(tree.range_search(-3, 3)) == [position[k] for k in range(-3, 3)]
+    assert list(tree.range_search(499, 2 ** 40)) == [position[499], position[2 ** 31]]
+
+def test_short_string_keys_as_ints():
+    """Test that 8-byte string keys keep their byte order when held as ints."""
+    words = ["pear", "apple", "fig", "banana", "kiwi", "cherry", "date", "grape", "lime", "melon"]
+    tree = BPlusTree(1, BPlusTreeConfig(order=3, key_size=8))
+    for i, word in enumerate(words):
+        tree.insert(word, i)
+    
+    for i, word in enumerate(words):
+        assert tree.search(word) == i
+    assert list(tree.range_search("b", "g")) == [
+        words.index(w) for w in ["banana", "cherry", "date", "fig"]
+    ]
+
+def test_bytes_keys_across_splits():
+    """Test that wider keys stay bytes and sort lexicographically."""
+    keys = [f"user{i:05d}".encode() for i in range(300)]
+    shuffled = keys[:]
+    random.Random(9).shuffle(shuffled)
+    
+    tree = BPlusTree(1, BPlusTreeConfig(order=5, key_size=16))
+    assert not tree.int_keys
+    for key in shuffled:
+        tree.insert(key.ljust(16, b"\x00"), int(key[4:]))
+    
+    assert _depth(tree) >= 3
+    for i, key in enumerate(keys):
+        assert tree.search(key.ljust(16, b"\x00")) == i
+    # str keys are padded to key_size, matching the padded bytes keys
+    assert tree.search("user00042") == 42
+    assert list(tree.range_search("user00100", "user00110")) == list(range(100, 110))
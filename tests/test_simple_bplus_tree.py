@@ -1,10 +1,13 @@
 """
 Simple but working B+ Tree implementation.
 """
+import random
 import struct
 from typing import List, Optional, Dict, Any, Iterator
 from dataclasses import dataclass
 
+from src.index import simple_bplus_tree
+
 @dataclass
 class TreeNode:
     """Simple tree node for B+ Tree."""
@@ -295,4 +298,73 @@ class SimpleBPlusTree:
         try:
             return struct.unpack("<Q", key_bytes)[0]
         except:
-            return key_bytes.decode('utf-8', errors='ignore')
\ No newline at end of file
+            return key_bytes.decode('utf-8', errors='ignore')
+
+def _depth(tree) -> int:
+    """Count the levels from the root down to the leaves."""
+    node, depth = tree.root, 1
+    while not node.is_leaf:
+        node, depth = node.children[0], depth + 1
+    return depth
+
+def _leaf_keys(tree) -> List[bytes]:
+    """Collect every key by following the leaf chain from the leftmost leaf."""
+    node = tree.root
+    while not node.is_leaf:
+        node = node.children[0]
+    keys = []
+    while node is not None:
+        keys.extend(node.keys)
+        node = node.next_leaf
+    return keys
+
+def test_bulk_load_builds_searchable_tree():
+    """Test that bulk_load builds a multi-level tree that later inserts can split."""
+    pairs = [(key, key * 10) for key in range(0, 1000, 2)]
+    shuffled = pairs[:]
+    random.Random(7).shuffle(shuffled)
+    
+    for items in (pairs, shuffled):
+        tree = simple_bplus_tree.SimpleBPlusTree(order=4)
+        tree.bulk_load(items)
+        assert _depth(tree) >= 4
+        
+        for key, value in pairs:
+            assert tree.search(key) == value
+        assert tree.search(1) is None
+        assert tree.range_search(100, 301) == [key * 10 for key in range(100, 301, 2)]
+        assert tree.range_search(-10, 5000) == [value for _, value in pairs]
+        
+        # Odd keys land between bulk-loaded ones and force splits at every level
+        for key in range(1, 1000, 2):
+            tree.insert(key, key * 10)
+        for key in range(1000):
+            assert tree.search(key) == key * 10
+        assert tree.range_search(0, 1000) == [key * 10 for key in range(1000)]
+        assert _leaf_keys(tree) == sorted(_leaf_keys(tree))
+
+def test_keys_sort_numerically():
+    """Test that serialized int and composite keys keep their natural order."""
+    ints = [-2 ** 40, -300, -1, 0, 1, 255, 256, 2 ** 40]
+    composites = [(-1, "z"), (0, "b"), (1, "a"), (1, "ab"), (2, "")]
+    
+    tree = simple_bplus_tree.SimpleBPlusTree(order=4)
+    for key in random.Random(3).sample(ints, len(ints)):
+        tree.insert(key, key)
+    assert tree.range_search(-2 ** 62, 2 ** 62) == ints
+    assert tree.range_search(-1, 256) == [-1, 0, 1, 255]
+    
+    tree = simple_bplus_tree.SimpleBPlusTree(order=4)
+    for key in reversed(composites):
+        tree.insert(key, key)
+    assert tree.range_search((-5, ""), (3, "")) == composites
+
+def test_composite_key_cache_keeps_part_types():
+    """Test that equal composite keys of different part types serialize apart."""
+    simple_bplus_tree._serialize((1, "x"))
+    tree = simple_bplus_tree.SimpleBPlusTree(order=4)
+    tree.insert((1.0, "x"), "float")
+    
+    simple_bplus_tree._serialize_parts.cache_clear()
+    assert tree.search((1.0, "x")) == "float"
+    assert simple_bplus_tree._serialize((1, "x")) != simple_bplus_tree._serialize((1.0, "x"))
@@ -0,0 +1,304 @@
+"""
+Test the SQL interface and query executor.
+"""
+import os
+import tempfile
+
+import pytest
+
+from src.catalog.catalog import Catalog
+from src.catalog.schema import ColumnSchema, DataType
+from src.storage.storage_manager import StorageManager
+from src.executor.query_executor import QueryExecutor, QueryType
+from src.parser.sql_interface import SimpleSQLParser, ParseCache
+from src.parser.lexer import SQLLexer, TokenType
+from src.index.simple_bplus_tree import IntSimpleBPlusTree
+
+@pytest.fixture
+def parser():
+    """Parser wired to an executor on a fresh temporary database."""
+    db_path = tempfile.mktemp(suffix='.db')
+    storage = StorageManager(db_path)
+    storage.create_database()
+    storage.open()
+
+    executor = QueryExecutor(Catalog(), storage)
+    parser = SimpleSQLParser(executor)
+    parser.parse_execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50), age INTEGER)"
+    )
+
+    yield parser
+
+    storage.close()
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+def test_parse_returns_plan(parser):
+    """Test that parse produces a plan without executing it."""
+    query_type, kwargs = parser.parse("INSERT INTO users VALUES (1, 'alice', 30);")
+    assert query_type == QueryType.INSERT
+    assert kwargs == {"table_name": "users", "values": [1, "alice", 30]}
+
+    result = parser.parse_execute("SELECT * FROM users")
+    assert result.data == []
+
+def test_parse_reuses_template(parser):
+    """Test that statements of the same shape share one cached parse."""
+    parser.parse("INSERT INTO users VALUES (1, 'alice', 30)")
+    _, kwargs = parser.parse("INSERT INTO users VALUES (2, 'bob, jr', -5)")
+
+    assert kwargs["values"] == [2, "bob, jr", -5]
+    assert parser.parse_cache.hits == 1
+    assert len(parser.parse_cache) == 1
+
+def test_cached_plan_is_not_shared(parser):
+    """Test that executing a cached plan cannot modify the cache."""
+    parser.parse_execute("INSERT INTO users VALUES (1, 'alice', 30)")
+    parser.parse_execute("UPDATE users SET age = 31")
+
+    _, kwargs = parser.parse("INSERT INTO users VALUES (1, 'alice', 30)")
+    assert kwargs["values"] == [1, "alice", 30]
+
+def test_execute_prepared(parser):
+    """Test that prepared statements bind parameters as values."""
+    sql = "INSERT INTO users VALUES (?, ?, ?)"
+    assert parser.execute_prepared(sql, (1, "it's ?", 30)).success
+    assert parser.execute_prepared(sql, (2, "bob", 25)).success
+    assert not parser.execute_prepared(sql, (3, "carol")).success
+
+    result = parser.parse_execute("SELECT * FROM users")
+    assert result.data == [
+        {"id": 1, "name": "it's ?", "age": 30},
+        {"id": 2, "name": "bob", "age": 25},
+    ]
+
+def test_insert_many(parser):
+    """Test bulk insertion through the executor."""
+    rows = [(i, f"user{i}", 20 + i) for i in range(1, 101)]
+    result = parser.executor.insert_many("users", rows)
+    assert result.success
+    assert result.rows_affected == 100
+
+    result = parser.parse_execute("SELECT * FROM users")
+    assert len(result.data) == 100
+    assert result.data[0] == {"id": 1, "name": "user1", "age": 21}
+
+def test_insert_many_validates_arity(parser):
+    """Test that a malformed row rejects the whole batch."""
+    result = parser.executor.insert_many("users", [(1, "alice", 30), (2, "bob")])
+    assert not result.success
+
+    result = parser.parse_execute("SELECT * FROM users")
+    assert result.data == []
+
+def test_parse_cache_evicts_least_recent():
+    """Test that the parse cache is bounded and evicts in LRU order."""
+    cache = ParseCache(maxsize=2)
+    cache.get("a", str.upper)
+    cache.get("b", str.upper)
+    cache.get("a", str.upper)
+    cache.get("c", str.upper)
+
+    assert len(cache) == 2
+    assert cache.get("a", str.lower) == "A"
+    assert cache.get("b", str.lower) == "b"
+
+def test_where_operators(parser):
+    """Test that every comparison operator filters rows."""
+    rows = [(1, "alice", 30), (2, "bob", 25), (3, "carol", 35)]
+    parser.executor.insert_many("users", rows)
+
+    expected = {
+        "age = 30": [1],
+        "age != 30": [2, 3],
+        "age > 25": [1, 3],
+        "age >= 30": [1, 3],
+        "age < 35": [1, 2],
+        "age <= 25": [2],
+        "name = 'bob'": [2],
+    }
+    for where, ids in expected.items():
+        result = parser.parse_execute(f"SELECT id FROM users WHERE {where}")
+        assert [row["id"] for row in result.data] == ids, where
+
+def test_where_and_conditions(parser):
+    """Test that AND joins conditions and unsupported clauses are rejected."""
+    rows = [(1, "alice", 30), (2, "bob", 25), (3, "carol", 35), (4, "bob", 40)]
+    parser.executor.insert_many("users", rows)
+
+    _, kwargs = parser.parse("SELECT id FROM users WHERE age > 1 AND name = 'a and b'")
+    assert kwargs["where_clause"] == {"age": (">", 1), "name": "a and b"}
+
+    result = parser.parse_execute("SELECT id FROM users WHERE name != 'alice' and age > 26")
+    assert [row["id"] for row in result.data] == [3, 4]
+
+    for where in ["age > 1 OR id = 2", "age > 1 AND age < 40", "age > 1 2"]:
+        assert not parser.parse_execute(f"DELETE FROM users WHERE {where}").success, where
+    assert len(parser.parse_execute("SELECT * FROM users").data) == 4
+
+def test_update_with_where(parser):
+    """Test that UPDATE applies SET only to matching rows."""
+    parser.executor.insert_many("users", [(1, "alice", 30), (2, "bob", 25)])
+
+    result = parser.parse_execute("UPDATE users SET age = 31, name = 'al' WHERE id = 1")
+    assert result.rows_affected == 1
+
+    result = parser.parse_execute("SELECT * FROM users")
+    assert result.data == [
+        {"id": 1, "name": "al", "age": 31},
+        {"id": 2, "name": "bob", "age": 25},
+    ]
+
+def test_update_casts_set_values(parser):
+    """Test that UPDATE casts SET values like INSERT and rejects bad ones."""
+    parser.executor.insert_many("users", [(1, "alice", 30), (2, "bob", 25)])
+
+    assert not parser.parse_execute("UPDATE users SET id = 2.5 WHERE id = 2").success
+    result = parser.parse_execute("UPDATE users SET id = 'abc' WHERE id = 2")
+    assert not result.success
+    assert result.message.startswith("Invalid value 'abc' for column 'id'")
+
+    assert parser.parse_execute("UPDATE users SET id = '3', age = 26.0 WHERE id = 2").success
+    result = parser.parse_execute("SELECT * FROM users WHERE id = 3")
+    assert result.data == [{"id": 3, "name": "bob", "age": 26}]
+    assert type(result.data[0]["age"]) is int
+
+def test_insert_coerces_column_types(parser):
+    """Test that inserted values are cast to their column types."""
+    sql = "INSERT INTO users VALUES (?, ?, ?)"
+    assert parser.execute_prepared(sql, ("1", 7, "30")).success
+    assert parser.execute_prepared(sql, (2, "bob", None)).success
+    assert not parser.execute_prepared(sql, (3, "carol", "old")).success
+
+    result = parser.parse_execute("SELECT * FROM users")
+    assert result.data == [
+        {"id": 1, "name": "7", "age": 30},
+        {"id": 2, "name": "bob", "age": None},
+    ]
+
+def test_insert_rejects_lossy_casts(parser):
+    """Test that values which would change when cast are rejected."""
+    sql = "INSERT INTO users VALUES (?, ?, ?)"
+    assert not parser.execute_prepared(sql, (1, "alice", 3.7)).success
+    assert parser.execute_prepared(sql, (2, "bob", 30.0)).success
+    assert parser.parse_execute("SELECT age FROM users").data == [{"age": 30}]
+
+def test_insert_casts_booleans(parser):
+    """Test that string booleans are parsed, not cast by truthiness."""
+    parser.parse_execute("CREATE TABLE flags (id INTEGER PRIMARY KEY, active BOOLEAN)")
+    sql = "INSERT INTO flags VALUES (?, ?)"
+    for i, value in enumerate(["false", "0", "TRUE", 1, False], start=1):
+        assert parser.execute_prepared(sql, (i, value)).success
+    assert not parser.execute_prepared(sql, (6, "maybe")).success
+    assert not parser.execute_prepared(sql, (7, 2)).success
+
+    result = parser.parse_execute("SELECT active FROM flags")
+    assert [row["active"] for row in result.data] == [False, False, True, True, False]
+
+def test_insert_blob_requires_bytes(parser):
+    """Test that BLOB columns accept bytes-like values only."""
+    columns = [ColumnSchema("id", DataType.INTEGER), ColumnSchema("body", DataType.BLOB)]
+    parser.executor.execute(QueryType.CREATE_TABLE, table_name="files", columns=columns)
+
+    def insert(body):
+        return parser.executor.execute(QueryType.INSERT, table_name="files", values=[1, body])
+    assert not insert(5).success
+    assert not insert("abc").success
+    assert insert(bytearray(b"abc")).success
+    result = parser.executor.execute(QueryType.SELECT, table_name="files")
+    assert result.data == [{"id": 1, "body": b"abc"}]
+
+def test_where_multiple_conditions(parser):
+    """Test that every condition of a WHERE clause must hold."""
+    rows = [(1, "alice", 30), (2, "bob", 25), (3, "carol", 35), (4, "bob", 40)]
+    parser.executor.insert_many("users", rows)
+
+    result = parser.executor.execute(
+        QueryType.SELECT, table_name="users", columns=["id"],
+        where_clause={"name": ("!=", "alice"), "age": (">", 26)}
+    )
+    assert [row["id"] for row in result.data] == [3, 4]
+
+def test_primary_key_lookup(parser):
+    """Test that primary key lookups stay correct across writes."""
+    parser.executor.insert_many("users", [(1, "alice", 30), (2, "bob", 25)])
+    assert not parser.parse_execute("INSERT INTO users VALUES (1, 'eve', 20)").success
+    assert not parser.parse_execute("UPDATE users SET id = 1 WHERE id = 2").success
+
+    parser.parse_execute("UPDATE users SET id = 5 WHERE id = 2")
+    assert parser.parse_execute("SELECT name FROM users WHERE id = 2").data == []
+    result = parser.parse_execute("SELECT name FROM users WHERE id = 5")
+    assert result.data == [{"name": "bob"}]
+    result = parser.executor.execute(
+        QueryType.SELECT, table_name="users", where_clause={"id": 5, "age": 30}
+    )
+    assert result.data == []
+
+    parser.parse_execute("DELETE FROM users WHERE id = 5")
+    assert parser.parse_execute("INSERT INTO users VALUES (5, 'carol', 35)").success
+    result = parser.parse_execute("SELECT name FROM users WHERE id = 5")
+    assert result.data == [{"name": "carol"}]
+
+def test_select_column_data(parser):
+    """Test that SELECT results are available column-wise and as rows."""
+    parser.executor.insert_many("users", [(1, "alice", 30), (2, "bob", 25)])
+
+    result = parser.parse_execute("SELECT name, age FROM users WHERE age < 30")
+    assert result.column_data == {"name": ["bob"], "age": [25]}
+    assert result.data == [{"name": "bob", "age": 25}]
+
+def test_lexer_tokens():
+    """Test that keywords match whole words and two-character operators lex."""
+    tokens = SQLLexer("select order_id FROM t WHERE a <= 'x y'").tokenize()
+    assert [(t.type, t.value) for t in tokens] == [
+        (TokenType.SELECT, "select"),
+        (TokenType.IDENTIFIER, "order_id"),
+        (TokenType.FROM, "FROM"),
+        (TokenType.IDENTIFIER, "t"),
+        (TokenType.WHERE, "WHERE"),
+        (TokenType.IDENTIFIER, "a"),
+        (TokenType.LESS_EQUALS, "<="),
+        (TokenType.STRING, "x y"),
+        (TokenType.EOF, ""),
+    ]
+
+    with pytest.raises(SyntaxError):
+        SQLLexer("SELECT @").tokenize()
+
+def test_lexer_from_file(tmp_path):
+    """Test that a mapped script lexes the same as the string."""
+    sql = "INSERT INTO t VALUES (1, 'café');\nSELECT * FROM t WHERE id >= 1;"
+    path = tmp_path / "script.sql"
+    path.write_text(sql, encoding="utf-8")
+
+    with SQLLexer.from_file(str(path)) as lexer:
+        tokens = lexer.tokenize()
+    assert lexer.sql.closed
+    assert tokens == SQLLexer(sql).tokenize()
+    assert tokens[7].value == "café"
+    assert tokens[-1].line == 2
+    # Columns count characters, as for a str script
+    assert [t.column for t in tokens] == [t.column for t in SQLLexer(sql).tokenize()]
+
+def test_integer_index(parser):
+    """Test that single integer columns get an int-keyed index that accepts NULL."""
+    parser.executor.insert_many("users", [(1, "alice", None), (2, "bob", 25)])
+    assert parser.parse_execute("CREATE INDEX idx_age ON users (age)").success
+
+    indexes = parser.executor.index_manager.indexes
+    assert type(indexes["pk_users"]) is IntSimpleBPlusTree
+    assert type(indexes["idx_age"]) is IntSimpleBPlusTree
+    assert indexes["idx_age"].range_search(None, 30) == [1, 2]
+    assert indexes["idx_age"].search(25) == 2
+
+def test_parse_execute_many(parser):
+    """Test that a script runs statement by statement, splitting outside quotes."""
+    results = parser.parse_execute_many(
+        "INSERT INTO users VALUES (1, 'a;b', 30);\n"
+        "INSERT INTO users VALUES (2, 'bob', 25);  ;\n"
+        "SELECT name FROM users WHERE age < 30"
+    )
+    assert [r.success for r in results] == [True, True, True]
+    assert results[2].data == [{"name": "bob"}]
+    assert parser.parse_execute("SELECT name FROM users WHERE id = 1").data == [{"name": "a;b"}]
@@ -7,6 +7,7 @@ import os
 from pathlib import Path
 from src.storage.storage_manager import StorageManager
 from src.storage.page import Page, PageType
+from src.storage.column_store import ColumnStore, Dictionary
 
 def test_page_serialization():
     """Test page serialization/deserialization."""
@@ -32,6 +33,10 @@ def test_page_serialization():
     # Verify data
     read_data = deserialized.read_data(offset, len(test_data))
     assert read_data == test_data
+    
+    # The checksum round-trips and does not depend on the previous one
+    assert deserialized.checksum == page.checksum
+    assert deserialized.serialize() == serialized
 
 def test_storage_manager_create():
     """Test database creation."""
@@ -55,6 +60,7 @@ def test_storage_manager_create():
         # Read a page
         page = storage.read_page(1)
         assert page.page_type == PageType.FREE
+        assert storage.read_page(5).page_id == 5
         
         # Close explicitly
         storage.close()
@@ -135,6 +141,68 @@ def test_storage_manager_extend():
                 time.sleep(0.1)
                 continue
 
+def test_storage_manager_batch():
+    """Test that batched page writes are deferred until the batch ends."""
+    db_path = tempfile.mktemp(suffix='.db')
+    
+    try:
+        storage = StorageManager(db_path)
+        storage.create_database()
+        storage.open()
+        
+        with storage.begin_batch():
+            for page_id in (3, 1, 2, 7):
+                page = Page(page_id, PageType.DATA, 42)
+                storage.write_page(page)
+            
+            # Queued pages are visible to reads but not yet on disk
+            assert storage.read_page(2).page_type == PageType.DATA
+            storage.file.seek(2 * Page.PAGE_SIZE)
+            on_disk = Page.deserialize(2, storage.file.read(Page.PAGE_SIZE))
+            assert on_disk.page_type == PageType.FREE
+        
+        for page_id in (1, 2, 3, 7):
+            page = storage.read_page(page_id)
+            assert page.page_type == PageType.DATA
+            assert page.table_id == 42
+        assert storage.read_page(4).page_type == PageType.FREE
+        
+        storage.close()
+    finally:
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+def test_storage_manager_page_cache():
+    """Test that cached pages are shared and dirty ones are written back."""
+    db_path = tempfile.mktemp(suffix='.db')
+    
+    try:
+        storage = StorageManager(db_path, cache_size=2)
+        storage.create_database()
+        storage.open()
+        
+        page = storage.read_page(1)
+        assert storage.read_page(1) is page
+        page.write_data(page.allocate_space(5), b"hello")
+        
+        # Evicting the modified page writes it back
+        storage.read_page(2)
+        storage.read_page(3)
+        assert storage.read_page(1) is not page
+        assert storage.read_page(1).read_data(Page.HEADER_SIZE, 5) == b"hello"
+        
+        # Closing writes back pages still in the cache
+        page = storage.read_page(4)
+        page.write_data(page.allocate_space(5), b"world")
+        storage.close()
+        
+        storage.open()
+        assert storage.read_page(4).read_data(Page.HEADER_SIZE, 5) == b"world"
+        storage.close()
+    finally:
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
 def test_page_edge_cases():
     """Test edge cases for page operations."""
     page = Page(1, PageType.DATA, 100)
@@ -182,5 +250,76 @@ def test_database_header():
     assert deserialized.free_list_head == 10
     assert deserialized.last_transaction_id == 12345
 
+def test_column_store_dictionary_encoding(monkeypatch):
+    """Test that encoded columns round-trip and fall back to flat storage."""
+    monkeypatch.setattr(Dictionary, "MAX_SIZE", 2)
+    store = ColumnStore(2, [False, True])
+    store.append(1, [10, "a"])
+    store.append(2, [20, "b"])
+    store.append(3, [30, "a"])
+
+    assert store.columns[1] == [0, 1, 0]
+    assert list(store.rows()) == [(10, "a"), (20, "b"), (30, "a")]
+
+    store.extend([4, 5], [(40, "b"), (50, "d")])
+    assert store.encodings[1] is None
+    assert store.position(5) == 4
+
+    store.update([1], 1, "c")
+    assert store.encodings[1] is None
+    assert store.columns[1] == ["a", "c", "a", "b", "d"]
+    assert store.get_row(1) == [20, "c"]
+
+def test_column_store_position():
+    """Test that row positions stay correct across deletes."""
+    store = ColumnStore(1)
+    for row_id in range(1, 5):
+        store.append(row_id, [row_id * 10])
+
+    assert store.position(3) == 2
+    store.delete(0)
+    assert store.position(1) == -1
+    assert store.position(3) == 1
+
+    store.append(7, [70])
+    assert store.position(7) == 3
+    assert store.get_row(store.position(4)) == [40]
+
+    store.delete_many([0, 2])
+    assert store.row_ids == [3, 7]
+    assert store.position(7) == 1
+
+def test_column_store_tombstones():
+    """Test that deleted rows are skipped until the store is compacted."""
+    store = ColumnStore(1)
+    store.extend(range(1, 11), [[row_id] for row_id in range(1, 11)])
+
+    store.delete_many([1, 3])
+    assert len(store.row_ids) == 10
+    assert len(store) == 8
+    assert store.position(2) == -1
+    assert store.position(5) == 4
+    assert list(store.rows())[:3] == [(1,), (3,), (5,)]
+
+    store.delete_many([0, 2])
+    assert store.live is None
+    assert store.row_ids == [5, 6, 7, 8, 9, 10]
+    assert store.position(5) == 0
+
+def test_column_store_packed_columns():
+    """Test that packed columns fall back to lists for values they cannot hold."""
+    store = ColumnStore(2, typecodes=['i', None])
+    store.extend([1, 2], [(10, "a"), (20, "b")])
+    assert store.columns[0].typecode == 'i'
+
+    store.append(3, [None, "c"])
+    assert isinstance(store.columns[0], list)
+    assert list(store.rows()) == [(10, "a"), (20, "b"), (None, "c")]
+
+    store = ColumnStore(1, typecodes=['i'])
+    store.extend([1], [(1,)])
+    store.update([0], 0, 2 ** 40)
+    assert store.get_row(0) == [2 ** 40]
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])